@@ -6,15 +6,32 @@ writing assistant. Provides secure access to Google Drive, Docs, and Sheets,
 as well as local file parsing capabilities.
 """
 
+import json
+import shutil
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+import httplib2
+from google.auth.exceptions import GoogleAuthError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
+# Optional: orjson for faster API response parsing
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # OAuth 2.0 Scopes
 SCOPES = [
@@ -27,6 +44,29 @@ SCOPES = [
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 CLIENT_SECRET_PATH = CONFIG_DIR / "client_secret.json"
 TOKEN_PATH = CONFIG_DIR / "token.json"
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+HTTP_CACHE_DIR = CONFIG_DIR / ".http_cache"
+HTTP_TIMEOUT_SECONDS = 30
+
+# Google Docs and Sheets MIME types, mapped to friendly names
+DOC_MIME_TYPES = {
+    "application/vnd.google-apps.document": "doc",
+    "application/vnd.google-apps.spreadsheet": "sheet",
+}
+# Drive query for Google Docs and Sheets
+RECENT_DOCS_QUERY = " or ".join(f"mimeType='{mime}'" for mime in DOC_MIME_TYPES)
+
+# Partial-response masks for documents.get: only the parts that are read
+TEXT_RUN_FIELDS = "paragraph/elements/textRun/content"
+DOC_TEXT_FIELDS = (
+    f"body/content({TEXT_RUN_FIELDS},"
+    f"table/tableRows/tableCells/content/{TEXT_RUN_FIELDS})"
+)
+DOC_END_INDEX_FIELDS = "body/content/endIndex"
+
+# Parsed discovery documents, keyed by (api, version)
+_discovery_docs: dict[tuple[str, str], dict] = {}
+_discovery_lock = threading.Lock()
 
 
 def authenticate_user() -> Credentials:
@@ -51,31 +91,164 @@ def authenticate_user() -> Credentials:
     if TOKEN_PATH.exists():
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
 
-    # If no valid credentials, initiate OAuth flow
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            # Refresh expired credentials
+    if creds and _should_refresh(creds):
+        try:
+            # Refresh expired or soon-to-expire credentials
             creds.refresh(Request())
+        except GoogleAuthError:
+            # A failed early refresh leaves a still-valid token usable
+            if not creds.valid:
+                raise
         else:
-            # Run full OAuth flow
-            if not CLIENT_SECRET_PATH.exists():
-                raise FileNotFoundError(
-                    f"Client secret not found at {CLIENT_SECRET_PATH}. "
-                    "Please download OAuth credentials from Google Cloud Console."
-                )
+            _save_token(creds)
 
-            flow = InstalledAppFlow.from_client_secrets_file(
-                str(CLIENT_SECRET_PATH), SCOPES
+    # If no valid credentials, initiate OAuth flow
+    if not creds or not creds.valid:
+        if not CLIENT_SECRET_PATH.exists():
+            raise FileNotFoundError(
+                f"Client secret not found at {CLIENT_SECRET_PATH}. "
+                "Please download OAuth credentials from Google Cloud Console."
             )
-            creds = flow.run_local_server(port=0)
+
+        flow = InstalledAppFlow.from_client_secrets_file(
+            str(CLIENT_SECRET_PATH), SCOPES
+        )
+        creds = flow.run_local_server(port=0)
 
         # Save credentials for future use
-        with open(TOKEN_PATH, "w") as token_file:
-            token_file.write(creds.to_json())
+        _save_token(creds)
 
     return creds
 
 
+def _should_refresh(creds: Credentials) -> bool:
+    """
+    Check whether credentials should be refreshed before use.
+
+    Tokens are refreshed up to TOKEN_REFRESH_MARGIN before they expire, so
+    the token exchange happens once, up front, and is saved to disk instead
+    of stalling a later API call.
+
+    Args:
+        creds: Credentials loaded from the token file.
+
+    Returns:
+        True if a refresh token is available and the access token has
+        expired or expires within the margin.
+    """
+    if not creds.refresh_token:
+        return False
+    if creds.expired:
+        return True
+    if creds.expiry is None:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < TOKEN_REFRESH_MARGIN
+
+
+def _discovery_document(api: str, version: str) -> Optional[dict]:
+    """
+    Return the parsed discovery document for an API, loading it once.
+
+    build_from_document fills in method parameters on the document the first
+    time each resource is used, so every resource is resolved once under the
+    lock before the document is shared between threads.
+
+    Args:
+        api: API name, e.g. 'drive'.
+        version: API version, e.g. 'v3'.
+
+    Returns:
+        Discovery document dict, or None if the client has no bundled copy.
+    """
+    key = (api, version)
+    document = _discovery_docs.get(key)
+    if document is not None:
+        return document
+
+    with _discovery_lock:
+        document = _discovery_docs.get(key)
+        if document is None:
+            raw = get_static_doc(api, version)
+            if raw is None:
+                return None
+            document = json.loads(raw)
+            _resolve_resources(
+                build_from_document(document, http=httplib2.Http()), document
+            )
+            _discovery_docs[key] = document
+    return document
+
+
+def _resolve_resources(resource, description: dict) -> None:
+    """Instantiate every nested resource so its method descriptions are fixed up."""
+    for name, child in description.get("resources", {}).items():
+        _resolve_resources(getattr(resource, name)(), child)
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that parses API response bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _response_model(document: Optional[dict]) -> Optional[JsonModel]:
+    """
+    Return the response model for a client, or None for the library default.
+
+    Args:
+        document: The API's discovery document, if available.
+
+    Returns:
+        OrjsonModel when orjson is installed, otherwise None.
+    """
+    if not ORJSON_AVAILABLE:
+        return None
+    features = (document or {}).get("features", [])
+    return OrjsonModel("dataWrapper" in features)
+
+
+def _build_service(
+    api: str, version: str, creds: Credentials, http_cache: bool = False
+):
+    """
+    Build a Google API client over its own authorized httplib2 transport.
+
+    httplib2's file cache stores response bodies unencrypted, so it is only
+    enabled for Drive file metadata; document text and profile data are never
+    written to disk. clear_credentials() purges it. The discovery document is parsed once per process
+    and reused, so cache_discovery is disabled for the fallback build.
+    Responses are parsed with orjson when it is installed. httplib2
+    objects are not thread-safe; callers must not share the returned service
+    across threads.
+
+    Args:
+        api: API name, e.g. 'drive'.
+        version: API version, e.g. 'v3'.
+        creds: Authenticated credentials.
+        http_cache: Whether to use the on-disk HTTP cache (metadata reads only).
+
+    Returns:
+        googleapiclient Resource for the requested API.
+    """
+    cache = str(HTTP_CACHE_DIR) if http_cache else None
+    http = AuthorizedHttp(
+        creds, http=httplib2.Http(cache=cache, timeout=HTTP_TIMEOUT_SECONDS)
+    )
+    document = _discovery_document(api, version)
+    model = _response_model(document)
+    if document is None:
+        return build(api, version, http=http, model=model, cache_discovery=False)
+    return build_from_document(document, http=http, model=model)
+
+
 def list_recent_docs(limit: int = 10) -> list[dict]:
     """
     List the most recently modified Google Docs and Sheets.
@@ -87,19 +260,14 @@ def list_recent_docs(limit: int = 10) -> list[dict]:
         List of dictionaries with keys: 'name', 'id', 'type'.
     """
     creds = authenticate_user()
-    service = build("drive", "v3", credentials=creds)
-
-    # Query for Google Docs and Sheets, ordered by modified time
-    query = (
-        "mimeType='application/vnd.google-apps.document' or "
-        "mimeType='application/vnd.google-apps.spreadsheet'"
-    )
+    # Only file ids, names and types are requested, so the listing may be cached
+    service = _build_service("drive", "v3", creds, http_cache=True)
 
     try:
         results = (
             service.files()
             .list(
-                q=query,
+                q=RECENT_DOCS_QUERY,
                 pageSize=limit,
                 orderBy="modifiedTime desc",
                 fields="files(id, name, mimeType)",
@@ -109,17 +277,11 @@ def list_recent_docs(limit: int = 10) -> list[dict]:
 
         files = results.get("files", [])
 
-        # Map MIME types to friendly names
-        mime_type_map = {
-            "application/vnd.google-apps.document": "doc",
-            "application/vnd.google-apps.spreadsheet": "sheet",
-        }
-
         return [
             {
                 "name": f["name"],
                 "id": f["id"],
-                "type": mime_type_map.get(f["mimeType"], "unknown"),
+                "type": DOC_MIME_TYPES.get(f["mimeType"], "unknown"),
             }
             for f in files
         ]
@@ -140,10 +302,12 @@ def load_google_doc(doc_id: str) -> str:
         Extracted text content as a string.
     """
     creds = authenticate_user()
-    service = build("docs", "v1", credentials=creds)
+    service = _build_service("docs", "v1", creds)
 
     try:
-        document = service.documents().get(documentId=doc_id).execute()
+        document = (
+            service.documents().get(documentId=doc_id, fields=DOC_TEXT_FIELDS).execute()
+        )
 
         # Parse document structure to extract text
         text_content = _extract_text_from_doc(document)
@@ -337,24 +501,32 @@ def get_credentials() -> Optional[Credentials]:
 
     try:
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
-        if creds.valid:
-            return creds
-        elif creds.expired and creds.refresh_token:
+    except Exception:
+        return None
+
+    if _should_refresh(creds):
+        try:
             creds.refresh(Request())
             # Save refreshed credentials
-            with open(TOKEN_PATH, "w") as token_file:
-                token_file.write(creds.to_json())
-            return creds
-    except Exception:
-        pass
+            _save_token(creds)
+        except (GoogleAuthError, OSError):
+            # Offline or a transient error: a still-valid token remains usable
+            pass
+
+    return creds if creds.valid else None
 
-    return None
+
+def _save_token(creds: Credentials) -> None:
+    """Write credentials to the token file for future sessions."""
+    with open(TOKEN_PATH, "w") as token_file:
+        token_file.write(creds.to_json())
 
 
 def clear_credentials() -> None:
-    """Remove stored OAuth token to force re-authentication."""
+    """Remove the stored OAuth token and cached API responses."""
     if TOKEN_PATH.exists():
         TOKEN_PATH.unlink()
+    shutil.rmtree(HTTP_CACHE_DIR, ignore_errors=True)
 
 
 # =============================================================================
@@ -408,9 +580,7 @@ def get_user_info() -> dict:
         if creds:
             # Build People API to get user info
             try:
-                from googleapiclient.discovery import build
-
-                service = build("people", "v1", credentials=creds)
+                service = _build_service("people", "v1", creds)
                 profile = (
                     service.people()
                     .get(resourceName="people/me", personFields="names,emailAddresses")
@@ -465,10 +635,14 @@ def update_google_doc(
                 "error": "Not authenticated. Please authenticate first.",
             }
 
-        service = build("docs", "v1", credentials=creds)
+        service = _build_service("docs", "v1", creds)
 
         # Get document to find end index
-        doc = service.documents().get(documentId=doc_id).execute()
+        doc = (
+            service.documents()
+            .get(documentId=doc_id, fields=DOC_END_INDEX_FIELDS)
+            .execute()
+        )
         body = doc.get("body", {})
         doc_content = body.get("content", [])
 
@@ -12,6 +12,8 @@ referencing guide. 12th edn. London: Bloomsbury Academic.
 import json
 import os
 import re
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -71,6 +73,11 @@ DATA_DIR = ROOT_DIR / "data"
 CACHE_DIR = DATA_DIR / "local_cache"
 CITATIONS_CACHE = DATA_DIR / "zotero_cache.json"
 
+# In-flight relevance lookups shared by concurrent sessions, so identical
+# drafting contexts trigger a single Claude call
+_INFLIGHT_RELEVANCE: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 # =============================================================================
 # MOCK ZOTERO - Synthetic Citation Library
@@ -840,7 +847,8 @@ class ZoteroSentinel:
         Get the most relevant papers for the current drafting context.
 
         Uses Claude to analyze relevance between the drafting context
-        and papers in the Zotero library.
+        and papers in the Zotero library. Concurrent requests for the same
+        context share a single lookup instead of each calling Claude.
 
         Args:
             drafting_context: Current text being drafted
@@ -850,6 +858,35 @@ class ZoteroSentinel:
         Returns:
             List of relevant papers with relevance scores and reasons
         """
+        key = (self.user_id, self.mock_mode, drafting_context, chapter_topic, top_n)
+
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT_RELEVANCE.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _INFLIGHT_RELEVANCE[key] = future
+
+        if not is_leader:
+            # Hand each waiter its own copies so callers can annotate freely
+            return [paper.copy() for paper in future.result()]
+
+        try:
+            papers = self._rank_relevant_papers(drafting_context, chapter_topic, top_n)
+            future.set_result(papers)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT_RELEVANCE.pop(key, None)
+
+        return papers
+
+    def _rank_relevant_papers(
+        self, drafting_context: str, chapter_topic: str, top_n: int
+    ) -> list[dict]:
+        """Rank library papers against the drafting context (uncoalesced)."""
         # Ensure we have items to search
         if not self.items_cache:
             self.fetch_all_items()
@@ -1427,6 +1464,11 @@ Respond with ONLY valid JSON array, no markdown."""
 # =============================================================================
 
 
+def _display_title(title: str, limit: int) -> str:
+    """Truncate a title for compact widget labels."""
+    return f"{title[:limit]}..." if len(title) > limit else title
+
+
 def render_sentinel_widget(
     sentinel: ZoteroSentinel, drafting_context: str, chapter: str = ""
 ):
@@ -1552,17 +1594,16 @@ def render_sentinel_widget(
                 papers = sentinel.get_relevant_papers(
                     drafting_context, chapter, top_n=5
                 )
+                # Truncate labels once here rather than on every rerun
+                for paper in papers:
+                    paper["_title_display"] = _display_title(paper["title"], 45)
                 st.session_state[context_key] = papers
         else:
             papers = st.session_state[context_key]
 
         if papers:
             for i, paper in enumerate(papers):
-                with st.expander(
-                    f"📄 {paper['title'][:45]}..."
-                    if len(paper["title"]) > 45
-                    else f"📄 {paper['title']}"
-                ):
+                with st.expander(f"📄 {paper['_title_display']}"):
                     st.markdown(f"**{paper['title']}**")
                     st.markdown(f"*{paper['authors']}* ({paper['year']})")
 
@@ -1580,7 +1621,7 @@ def render_sentinel_widget(
                     # Insert Citation button
                     if st.button(
                         "📎 Insert Citation",
-                        key=f"insert_cite_{i}_{paper['key']}",
+                        key=f"insert_cite_{paper['key'] or i}",
                         use_container_width=True,
                     ):
                         st.session_state.pending_citation = {
@@ -1597,6 +1638,7 @@ def render_sentinel_widget(
                                     "inline": inline,
                                     "full": full_ref,
                                     "title": paper["title"],
+                                    "title_display": _display_title(paper["title"], 30),
                                 }
                             )
                         st.rerun()
@@ -1615,19 +1657,27 @@ def render_sentinel_widget(
             search_results = sentinel.search_library(search_query, limit=5)
             if search_results:
                 st.markdown(f"**Results for '{search_query}':**")
-                for j, result in enumerate(search_results):
-                    inline = sentinel.format_inline_citation(result)
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"• {result['title'][:40]}... ({result['year']})")
-                    with col2:
-                        if st.button("📎", key=f"search_cite_{j}"):
-                            st.session_state.pending_citation = {
-                                "inline": inline,
-                                "full": sentinel.format_as_brookes_harvard(result),
-                                "paper": result,
-                            }
-                            st.rerun()
+                labels = [
+                    f"{_display_title(result['title'], 40)} ({result['year']})"
+                    for result in search_results
+                ]
+                st.markdown("\n".join(f"• {label}" for label in labels))
+
+                # One picker + button instead of a column pair per result
+                choice = st.selectbox(
+                    "Insert which?",
+                    range(len(search_results)),
+                    format_func=lambda j: labels[j],
+                    key="search_cite_choice",
+                )
+                if st.button("📎 Insert", key="search_cite"):
+                    result = search_results[choice]
+                    st.session_state.pending_citation = {
+                        "inline": sentinel.format_inline_citation(result),
+                        "full": sentinel.format_as_brookes_harvard(result),
+                        "paper": result,
+                    }
+                    st.rerun()
             else:
                 st.info("No results found")
     else:
@@ -1638,7 +1688,7 @@ def render_sentinel_widget(
         st.markdown("---")
         st.markdown("**Recent Citations:**")
         for hist in st.session_state.citation_history[-3:]:
-            st.caption(f"`{hist['inline']}` - {hist['title'][:30]}...")
+            st.caption(f"`{hist['inline']}` - {hist['title_display']}")
 
 
 # =============================================================================
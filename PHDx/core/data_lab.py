@@ -13,7 +13,16 @@ Designed for desk research analyzing review site data.
 """
 
 import hashlib
+import importlib.util
 import json
+import logging
+import os
+import string
+import threading
+import uuid
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
@@ -34,30 +43,348 @@ except ImportError:
 try:
     import plotly.express as px
     import plotly.graph_objects as go
+    import plotly.io as pio
 
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
     px = None
     go = None
+    pio = None
 
 try:
-    from transformers import pipeline
+    from transformers import AutoConfig, AutoTokenizer, pipeline
 
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
+    AutoConfig = None
+    AutoTokenizer = None
     pipeline = None
 
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    ort = None
+    ORTModelForSequenceClassification = None
+    ORTQuantizer = None
+    AutoQuantizationConfig = None
+
+try:
+    import cupy
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+    cupy = None
+
+# pandas drives calamine itself, so only check that it is installed
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pa_csv = None
+
 # Local imports
 from core.secrets_utils import get_secret
 from core.ethics_utils import log_ai_usage
 
+logger = logging.getLogger(__name__)
+
 # Paths
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "data"
 ANALYSIS_CACHE = DATA_DIR / "analysis_cache"
 ANALYSIS_CACHE.mkdir(parents=True, exist_ok=True)
+ONNX_MODEL_DIR = ANALYSIS_CACHE / "sentiment_onnx"
+
+# Pandas dtypes mapped to EDA column types
+DTYPE_CATEGORIES = {
+    "int64": "numeric",
+    "int32": "numeric",
+    "float64": "numeric",
+    "float32": "numeric",
+    "object": "text",
+    "bool": "boolean",
+    "datetime64[ns]": "datetime",
+    "category": "categorical",
+}
+
+# EDA reports kept in ANALYSIS_CACHE before the oldest are evicted
+EDA_CACHE_MAX_FILES = 100
+
+# Values sampled per numeric column to estimate quartiles in streaming EDA
+QUANTILE_SAMPLE_SIZE = 100_000
+
+# Distinct rows/values counted exactly in streaming EDA before switching to
+# a HyperLogLog estimate (2**HLL_PRECISION one-byte registers, ~0.8% error)
+STREAMING_EXACT_DISTINCT = 100_000
+HLL_PRECISION = 14
+
+# Pearson matrices at least this wide are computed on the GPU when available
+GPU_CORR_MIN_COLUMNS = 50
+
+# CSVs above this size are parsed with pyarrow's multi-threaded reader
+ARROW_CSV_THRESHOLD = 10_000_000
+
+# pandas.read_csv's default missing-value markers, so pyarrow reads agree
+PANDAS_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Chart figures kept in the per-DataLab figure cache
+CHART_CACHE_SIZE = 32
+
+# Narrative LLM requests sent at once by generate_analysis_narratives
+NARRATIVE_MAX_CONCURRENCY = 4
+
+# Characters of serialized analysis results included in a narrative prompt
+NARRATIVE_SUMMARY_CHARS = 4000
+
+NARRATIVE_PROMPT_TEMPLATE = """You are a PhD research assistant helping write a thesis.
+
+Convert the following statistical analysis results into academic prose suitable for a {section_type} section.
+
+Requirements:
+- Use formal academic language
+- Report statistics correctly (e.g., "t(df) = X.XX, p < .05")
+- Interpret findings in context
+- Use hedging language appropriately (e.g., "suggests", "indicates")
+- Keep the narrative concise but thorough
+
+Analysis Results:
+{summary}
+
+Write 2-3 paragraphs of thesis-ready text:"""
+
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+SENTIMENT_CACHE_SIZE = 200_000  # Max texts kept in the per-DataLab score cache
+
+# Lexicons for the rule-based sentiment fallback
+POSITIVE_WORDS = frozenset(
+    [
+        "good",
+        "great",
+        "excellent",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "love",
+        "best",
+        "perfect",
+        "beautiful",
+        "friendly",
+        "helpful",
+        "recommend",
+        "delicious",
+        "outstanding",
+        "superb",
+        "lovely",
+    ]
+)
+NEGATIVE_WORDS = frozenset(
+    [
+        "bad",
+        "terrible",
+        "awful",
+        "horrible",
+        "worst",
+        "poor",
+        "hate",
+        "disappointed",
+        "disgusting",
+        "rude",
+        "dirty",
+        "slow",
+        "cold",
+        "overpriced",
+        "avoid",
+        "never",
+    ]
+)
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+# Normalized sentiment labels, indexed by integer label code
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+
+# |r| band edges and the interpretation for each band, by direction
+CORRELATION_THRESHOLDS = np.array([0.1, 0.3, 0.5, 0.7])
+POSITIVE_CORRELATION_LABELS = np.array(
+    [
+        "negligible",
+        "weak positive",
+        "moderate positive",
+        "strong positive",
+        "very strong positive",
+    ],
+    dtype=object,
+)
+NEGATIVE_CORRELATION_LABELS = np.array(
+    [
+        "negligible",
+        "weak negative",
+        "moderate negative",
+        "strong negative",
+        "very strong negative",
+    ],
+    dtype=object,
+)
+
+
+def _json_default(obj):
+    """Serialize numpy scalars and other non-JSON values in reports."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _is_plain_option(value) -> bool:
+    """Whether a chart option's repr fully identifies it (scalars and containers)."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain_option(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            _is_plain_option(key) and _is_plain_option(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _json_round_trips(value) -> bool:
+    """Whether JSON encoding and decoding would return value unchanged."""
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _json_round_trips(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return all(_json_round_trips(item) for item in value)
+    # numpy scalars come back as the equal Python numbers
+    return value is None or isinstance(
+        value, (str, bool, int, float, np.bool_, np.integer, np.floating)
+    )
+
+
+class _DistinctCounter:
+    """
+    Count distinct 64-bit hashes in bounded memory.
+
+    Hashes are kept exactly until more than STREAMING_EXACT_DISTINCT are
+    distinct; from then on only the HyperLogLog registers, updated for
+    every hash from the start, are kept and the count is an estimate.
+    """
+
+    def __init__(self):
+        self.exact = np.empty(0, dtype=np.uint64)
+        self.registers = np.zeros(1 << HLL_PRECISION, dtype=np.uint8)
+
+    @property
+    def estimated(self) -> bool:
+        return self.exact is None
+
+    def add(self, hashes: np.ndarray):
+        """Add a batch of uint64 hashes."""
+        if self.exact is not None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) > STREAMING_EXACT_DISTINCT:
+                self.exact = None
+
+        # Leading bits pick the register, the rest give the rank: the
+        # position of the first set bit, found exactly on 32-bit halves
+        index = (hashes >> np.uint64(64 - HLL_PRECISION)).astype(np.intp)
+        rest = hashes << np.uint64(HLL_PRECISION)
+        high = np.frexp((rest >> np.uint64(32)).astype(np.float64))[1]
+        low = np.frexp((rest & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+        bit_length = np.where(high > 0, high + 32, low)
+        rank = np.minimum(65 - bit_length, 65 - HLL_PRECISION).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        """Distinct hashes seen, exact unless estimated is True."""
+        if self.exact is not None:
+            return len(self.exact)
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class _OnnxSentimentScorer:
+    """
+    Sentiment classifier over an ONNX Runtime session.
+
+    Called like the transformers pipeline it replaces, returning every label
+    with its softmax score per text. Tokenization and inference are also
+    exposed separately, so a single thread can tokenize (fast tokenizers are
+    not thread-safe) while InferenceSession.run, which is, runs in a pool.
+    """
+
+    def __init__(self, session, tokenizer, labels: dict):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.labels = labels
+        self.input_names = {node.name for node in session.get_inputs()}
+
+    def tokenize(self, texts: list) -> dict:
+        """Encode a batch of texts into padded model inputs."""
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, return_tensors="np"
+        )
+        return {
+            name: value for name, value in encoded.items() if name in self.input_names
+        }
+
+    def run(self, inputs: dict) -> list:
+        """Score encoded inputs as [{label, score}, ...] lists, best first."""
+        logits = self.session.run(["logits"], inputs)[0]
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        scores = exp / exp.sum(axis=1, keepdims=True)
+        return [
+            [
+                {"label": self.labels[i], "score": float(row[i])}
+                for i in np.argsort(row)[::-1]
+            ]
+            for row in scores
+        ]
+
+    def __call__(self, texts: list, batch_size: Optional[int] = None) -> list:
+        return self.run(self.tokenize(texts))
 
 
 class DataLab:
@@ -71,6 +398,15 @@ class DataLab:
     def __init__(self):
         """Initialize the Data Lab with optional components."""
         self._sentiment_pipeline = None
+        # One DataLab is shared across sessions and threads (get_data_lab),
+        # so every cache has its own lock
+        self._sentiment_cache = OrderedDict()
+        self._sentiment_lock = threading.Lock()
+        self._sentiment_workers = 1
+        self._corr_cache = None
+        self._corr_lock = threading.Lock()
+        self._chart_cache = OrderedDict()
+        self._chart_lock = threading.Lock()
         self._llm_available = False
 
         # Check LLM availability for narrative generation
@@ -90,6 +426,9 @@ class DataLab:
         """
         Load data from a CSV file.
 
+        Large files on disk are parsed with pyarrow's block-parallel reader
+        when it is installed and no pandas-specific arguments are given.
+
         Args:
             file_path: Path to CSV file or file-like object
             **kwargs: Additional pandas read_csv arguments
@@ -97,12 +436,83 @@ class DataLab:
         Returns:
             dict with status, dataframe, and metadata
         """
+        if (
+            PYARROW_AVAILABLE
+            and not kwargs
+            and isinstance(file_path, (str, Path))
+            and os.path.isfile(file_path)
+            and os.path.getsize(file_path) > ARROW_CSV_THRESHOLD
+        ):
+            try:
+                df = self._read_csv_arrow(file_path)
+            except (pa.ArrowException, UnicodeDecodeError) as e:
+                logger.warning(
+                    "pyarrow could not parse %s (%s); using pandas", file_path, e
+                )
+            else:
+                if df is not None:
+                    return self._create_load_result(df, "csv", str(file_path))
+                logger.warning(
+                    "pyarrow inferred date columns in %s; using pandas", file_path
+                )
+
         try:
             df = pd.read_csv(file_path, **kwargs)
             return self._create_load_result(df, "csv", str(file_path))
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def _read_csv_arrow(self, file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
+        """
+        Parse a CSV with pyarrow into the frame pd.read_csv would return.
+
+        Missing values, booleans and string columns follow pandas' defaults,
+        and columns pyarrow would read as dates or times are kept as text,
+        since pandas does not parse dates unless asked. Returns None when a
+        column still comes back temporal, so the caller can use pandas.
+        """
+        read_options = pa_csv.ReadOptions(use_threads=True, block_size=32 << 20)
+        convert_options = pa_csv.ConvertOptions(
+            null_values=PANDAS_NA_VALUES,
+            strings_can_be_null=True,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+        )
+        with pa_csv.open_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        ) as reader:
+            schema = reader.schema
+        convert_options.column_types = {
+            field.name: pa.string()
+            for field in schema
+            if pa.types.is_temporal(field.type)
+        }
+
+        table = pa_csv.read_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        )
+        if any(pa.types.is_temporal(field.type) for field in table.schema):
+            return None
+
+        # Booleans with gaps become object columns holding NaN, as in pandas
+        nullable_bools = [
+            field.name
+            for field, column in zip(table.schema, table.columns)
+            if pa.types.is_boolean(field.type) and column.null_count
+        ]
+
+        # Strings use pandas' default text dtype ("str" on pandas 3, object before)
+        text_dtype = pd.Series(["text"]).dtype
+        df = table.to_pandas(
+            self_destruct=True,
+            types_mapper=None
+            if text_dtype == object
+            else lambda t: text_dtype if pa.types.is_string(t) else None,
+        )
+        for col in nullable_bools:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+        return df
+
     def load_excel(
         self,
         file_path: Union[str, Path, io.BytesIO],
@@ -112,6 +522,10 @@ class DataLab:
         """
         Load data from an Excel file.
 
+        Uses the streaming calamine reader when python-calamine is installed
+        and no engine was requested; it avoids building openpyxl's in-memory
+        cell model and is several times faster on large workbooks.
+
         Args:
             file_path: Path to Excel file or file-like object
             sheet_name: Specific sheet to load (None = first sheet)
@@ -120,6 +534,17 @@ class DataLab:
         Returns:
             dict with status, dataframe, and metadata
         """
+        if CALAMINE_AVAILABLE and "engine" not in kwargs:
+            try:
+                df = pd.read_excel(
+                    file_path, sheet_name=sheet_name or 0, engine="calamine", **kwargs
+                )
+                return self._create_load_result(df, "excel", str(file_path))
+            except Exception:
+                # Fall back to pandas' default engine
+                if hasattr(file_path, "seek"):
+                    file_path.seek(0)
+
         try:
             df = pd.read_excel(file_path, sheet_name=sheet_name or 0, **kwargs)
             return self._create_load_result(df, "excel", str(file_path))
@@ -200,73 +625,407 @@ class DataLab:
     # EXPLORATORY DATA ANALYSIS
     # =========================================================================
 
-    def run_eda(self, df: pd.DataFrame) -> dict:
+    def run_eda(
+        self,
+        df: pd.DataFrame,
+        use_cache: bool = True,
+        column_types: Optional[tuple] = None,
+    ) -> dict:
         """
         Run automated Exploratory Data Analysis.
 
+        Reports are cached in ANALYSIS_CACHE keyed by the frame's content
+        and schema, so re-analyzing the same data returns immediately.
+
         Args:
             df: DataFrame to analyze
+            use_cache: Read and write the on-disk report cache
+            column_types: (numeric_cols, categorical_cols) from _column_types,
+                when the caller has already classified the columns
 
         Returns:
             Comprehensive EDA report dict
         """
-        report_id = hashlib.md5(
-            f"{len(df)}_{list(df.columns)[:3]}".encode(), usedforsecurity=False
-        ).hexdigest()[:12]
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+        cache_path = None
+        if use_cache:
+            cache_path = self._eda_cache_path(df, row_hashes)
+            cached = self._load_eda_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        report_id = hashlib.blake2b(
+            f"{len(df)}_{list(df.columns)[:3]}".encode(), digest_size=6
+        ).hexdigest()
+        numeric_cols, cat_cols = column_types or self._column_types(df)
 
         eda_report = {
             "report_id": report_id,
             "timestamp": datetime.now().isoformat(),
             "status": "success",
-            "overview": self._get_overview(df),
+            "overview": self._get_overview(df, row_hashes),
             "data_types": self._analyze_data_types(df),
             "missing_values": self._analyze_missing(df),
-            "numeric_summary": self._summarize_numeric(df),
-            "categorical_summary": self._summarize_categorical(df),
-            "correlations": self._analyze_correlations(df),
+            "numeric_summary": self._summarize_numeric(df, numeric_cols),
+            "categorical_summary": self._summarize_categorical(df, cat_cols),
+            "correlations": self._analyze_correlations(df, numeric_cols),
         }
 
+        # Reports with non-string keys or values JSON can't carry (e.g.
+        # integer column labels, Timestamps) would come back changed
+        if cache_path is not None and _json_round_trips(eda_report):
+            text = json.dumps(eda_report, default=_json_default)
+            self._save_eda_cache(cache_path, text)
+            # Return exactly what a cache hit would, e.g. numpy floats as floats
+            eda_report = json.loads(text)
+
         return eda_report
 
-    def _get_overview(self, df: pd.DataFrame) -> dict:
+    def _column_types(self, df: pd.DataFrame) -> tuple:
+        """Classify the columns once as (numeric_cols, categorical_cols)."""
+        return (
+            df.select_dtypes(include=[np.number]).columns,
+            df.select_dtypes(include=["object", "category"]).columns,
+        )
+
+    def _eda_cache_path(self, df: pd.DataFrame, row_hashes: np.ndarray) -> Path:
+        """Get the cache file for a frame's content and schema."""
+        return ANALYSIS_CACHE / f"eda_{self._frame_digest(df, row_hashes)}.json"
+
+    def _frame_digest(
+        self, df: pd.DataFrame, row_hashes: Optional[np.ndarray] = None
+    ) -> str:
+        """Hash a frame's content and schema."""
+        if row_hashes is None:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        schema = ",".join(f"{col}:{dtype}" for col, dtype in df.dtypes.items())
+        return hashlib.blake2b(
+            row_hashes.tobytes() + schema.encode(), digest_size=16
+        ).hexdigest()
+
+    def _load_eda_cache(self, cache_path: Path) -> Optional[dict]:
+        """Load a cached EDA report, marking it recently used."""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+            cache_path.touch()
+            return report
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    def _save_eda_cache(self, cache_path: Path, report_json: str):
+        """Save an EDA report, evicting the least recently used beyond the cap."""
+        # Written to a temp file first so readers never see a partial report
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(report_json, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+
+            cached = sorted(
+                ANALYSIS_CACHE.glob("eda_*.json"), key=lambda p: p.stat().st_mtime
+            )
+            for stale in cached[: max(0, len(cached) - EDA_CACHE_MAX_FILES)]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            cache_path.unlink(missing_ok=True)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def run_eda_streaming(
+        self, file_path: Union[str, Path], chunksize: int = 500_000, **kwargs
+    ) -> dict:
+        """
+        Run EDA over a CSV file in chunks, without loading it whole.
+
+        Produces the same report as run_eda while holding one chunk plus
+        fixed-size summaries in memory. Moments are merged chunk by chunk and
+        correlations come from pairwise co-moment sums. Quartiles are
+        estimated from a uniform sample of up to QUANTILE_SAMPLE_SIZE values
+        per column, so they are exact for smaller columns.
+
+        Duplicate rows and per-column unique values are counted exactly up
+        to STREAMING_EXACT_DISTINCT distinct hashes and estimated with
+        HyperLogLog beyond that; estimated figures are flagged with
+        "duplicates_estimated" in the overview and "unique_values_estimated"
+        per column. Categorical columns with more distinct values than that
+        keep only their most frequent values, so most_common is approximate
+        and least_common is omitted for them.
+
+        Args:
+            file_path: Path to CSV file
+            chunksize: Rows per chunk
+            **kwargs: Additional pandas read_csv arguments
+
+        Returns:
+            Comprehensive EDA report dict
+        """
+        rng = np.random.default_rng(0)
+        columns = None
+        rows = 0
+        memory_bytes = 0
+
+        try:
+            for chunk in pd.read_csv(file_path, chunksize=chunksize, **kwargs):
+                if columns is None:
+                    columns = list(chunk.columns)
+                    dtypes = {col: str(chunk[col].dtype) for col in columns}
+                    numeric_cols = chunk.select_dtypes(
+                        include=[np.number]
+                    ).columns.tolist()
+                    cat_cols = chunk.select_dtypes(
+                        include=["object", "category"]
+                    ).columns.tolist()
+
+                    k = len(numeric_cols)
+                    shift = None
+                    count = np.zeros(k)
+                    mean = np.zeros(k)
+                    m2 = np.zeros(k)
+                    m3 = np.zeros(k)
+                    col_min = np.full(k, np.inf)
+                    col_max = np.full(k, -np.inf)
+                    pair_n = np.zeros((k, k))
+                    pair_sx = np.zeros((k, k))
+                    pair_sxx = np.zeros((k, k))
+                    pair_sxy = np.zeros((k, k))
+
+                    missing = pd.Series(0, index=columns)
+                    distinct_rows = _DistinctCounter()
+                    distinct_values = {col: _DistinctCounter() for col in columns}
+                    sample_values = {col: [] for col in columns}
+                    samples = {col: (np.empty(0), np.empty(0)) for col in numeric_cols}
+                    cat_counts = {col: pd.Series(dtype="int64") for col in cat_cols}
+                    truncated = set()
+
+                rows += len(chunk)
+                memory_bytes += chunk.memory_usage(deep=True).sum()
+                missing += chunk.isnull().sum()
+                distinct_rows.add(
+                    pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+                )
+
+                for col in columns:
+                    values = chunk[col].dropna()
+                    distinct_values[col].add(
+                        pd.util.hash_pandas_object(values, index=False).to_numpy()
+                    )
+                    needed = 3 - len(sample_values[col])
+                    if needed > 0:
+                        sample_values[col].extend(values.head(needed).tolist())
+
+                for col in cat_cols:
+                    counts = cat_counts[col].add(
+                        chunk[col].value_counts(), fill_value=0
+                    )
+                    if len(counts) > STREAMING_EXACT_DISTINCT:
+                        counts = counts.nlargest(STREAMING_EXACT_DISTINCT // 2)
+                        truncated.add(col)
+                    cat_counts[col] = counts
+
+                if not numeric_cols:
+                    continue
+
+                x = (
+                    chunk[numeric_cols]
+                    .apply(pd.to_numeric, errors="coerce")
+                    .to_numpy(dtype=np.float64)
+                )
+                present = ~np.isnan(x)
+                n_b = present.sum(axis=0).astype(np.float64)
+
+                # Merge this chunk's central moments into the running totals
+                sums = np.where(present, x, 0.0).sum(axis=0)
+                mean_b = np.divide(sums, n_b, out=np.zeros(k), where=n_b > 0)
+                dev = np.where(present, x - mean_b, 0.0)
+                m2_b = (dev**2).sum(axis=0)
+                m3_b = (dev**3).sum(axis=0)
+
+                n = count + n_b
+                safe_n = np.where(n > 0, n, 1.0)
+                delta = mean_b - mean
+                m3 = (
+                    m3
+                    + m3_b
+                    + delta**3 * count * n_b * (count - n_b) / safe_n**2
+                    + 3 * delta * (count * m2_b - n_b * m2) / safe_n
+                )
+                m2 = m2 + m2_b + delta**2 * count * n_b / safe_n
+                mean = mean + delta * n_b / safe_n
+                count = n
+
+                col_min = np.minimum(col_min, np.where(present, x, np.inf).min(axis=0))
+                col_max = np.maximum(col_max, np.where(present, x, -np.inf).max(axis=0))
+
+                # Pairwise co-moments, shifted by the first chunk's means
+                if shift is None:
+                    shift = mean_b
+                xs = np.where(present, x - shift, 0.0)
+                weights = present.astype(np.float64)
+                pair_n += weights.T @ weights
+                pair_sx += xs.T @ weights
+                pair_sxx += (xs * xs).T @ weights
+                pair_sxy += xs.T @ xs
+
+                # Keep a uniform bottom-k sample of each column for quartiles
+                for j, col in enumerate(numeric_cols):
+                    col_values = x[present[:, j], j]
+                    keys = np.concatenate(
+                        [samples[col][0], rng.random(len(col_values))]
+                    )
+                    kept = np.concatenate([samples[col][1], col_values])
+                    if len(keys) > QUANTILE_SAMPLE_SIZE:
+                        keep = np.argpartition(keys, QUANTILE_SAMPLE_SIZE)[
+                            :QUANTILE_SAMPLE_SIZE
+                        ]
+                        keys, kept = keys[keep], kept[keep]
+                    samples[col] = (keys, kept)
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+        if columns is None:
+            return {"status": "error", "error": "No data to analyze"}
+
+        # Data types
+        type_columns = {}
+        for col in columns:
+            unique = distinct_values[col].count()
+            type_columns[col] = {
+                "pandas_dtype": dtypes[col],
+                "inferred_type": self._infer_column_type(dtypes[col], unique, rows),
+                "unique_values": unique,
+                "sample_values": sample_values[col],
+            }
+            if distinct_values[col].estimated:
+                type_columns[col]["unique_values_estimated"] = True
+
+        # Numeric summary
+        if numeric_cols:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                std = np.sqrt(m2 / (count - 1))
+                skew = np.where(
+                    m2 > 0,
+                    np.sqrt(count * (count - 1))
+                    / (count - 2)
+                    * (m3 / count)
+                    / (m2 / count) ** 1.5,
+                    0.0,
+                )
+            numeric_columns = {}
+            for j, col in enumerate(numeric_cols):
+                sample = samples[col][1]
+                quartiles = (
+                    np.quantile(sample, [0.25, 0.5, 0.75])
+                    if len(sample)
+                    else [np.nan] * 3
+                )
+                numeric_columns[col] = {
+                    "count": int(count[j]),
+                    "mean": round(float(mean[j]), 4) if count[j] else np.nan,
+                    "std": round(float(std[j]), 4),
+                    "min": float(col_min[j]) if count[j] else np.nan,
+                    "25%": float(quartiles[0]),
+                    "50%": float(quartiles[1]),
+                    "75%": float(quartiles[2]),
+                    "max": float(col_max[j]) if count[j] else np.nan,
+                    "skewness": round(float(skew[j]), 4) if count[j] > 2 else None,
+                }
+            numeric_summary = {"columns": numeric_columns}
+        else:
+            numeric_summary = {"columns": {}, "message": "No numeric columns found"}
+
+        # Categorical summary
+        if cat_cols:
+            categorical_summary = {"columns": {}}
+            for col in cat_cols:
+                summary = self._describe_value_counts(cat_counts[col].astype("int64"))
+                if col in truncated:
+                    summary.update(
+                        unique_values=distinct_values[col].count(),
+                        unique_values_estimated=True,
+                        least_common={},
+                    )
+                categorical_summary["columns"][col] = summary
+        else:
+            categorical_summary = {
+                "columns": {},
+                "message": "No categorical columns found",
+            }
+
+        # Correlations (pairwise-complete Pearson, as DataFrame.corr)
+        if len(numeric_cols) >= 2:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sx, sy = pair_sx, pair_sx.T
+                cov = pair_sxy - sx * sy / pair_n
+                var_x = pair_sxx - sx**2 / pair_n
+                var_y = pair_sxx.T - sy**2 / pair_n
+                corr = cov / np.sqrt(var_x * var_y)
+            corr = np.clip(corr, -1.0, 1.0)
+            diagonal = np.diag_indices(len(numeric_cols))
+            corr[diagonal] = np.where(np.isnan(corr[diagonal]), np.nan, 1.0)
+            correlations = self._format_correlations(
+                pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+            )
+        else:
+            correlations = {"matrix": {}, "message": "Need at least 2 numeric columns"}
+
+        overview = {
+            "rows": rows,
+            "columns": len(columns),
+            "total_cells": rows * len(columns),
+            "memory_mb": round(memory_bytes / 1024 / 1024, 2),
+            "duplicates": max(rows - distinct_rows.count(), 0),
+        }
+        if distinct_rows.estimated:
+            overview["duplicates_estimated"] = True
+
+        report_id = hashlib.blake2b(
+            f"{rows}_{columns[:3]}".encode(), digest_size=6
+        ).hexdigest()
+
+        return {
+            "report_id": report_id,
+            "timestamp": datetime.now().isoformat(),
+            "status": "success",
+            "overview": overview,
+            "data_types": self._summarize_types(type_columns),
+            "missing_values": self._format_missing(missing, rows),
+            "numeric_summary": numeric_summary,
+            "categorical_summary": categorical_summary,
+            "correlations": correlations,
+        }
+
+    def _get_overview(
+        self, df: pd.DataFrame, row_hashes: Optional[np.ndarray] = None
+    ) -> dict:
         """Get dataset overview."""
+        # Count duplicate rows from one 64-bit hash per row rather than
+        # df.duplicated(), which builds a hash table over every column
+        if row_hashes is None:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
         return {
             "rows": len(df),
             "columns": len(df.columns),
             "total_cells": len(df) * len(df.columns),
             "memory_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2),
-            "duplicates": df.duplicated().sum(),
+            "duplicates": len(row_hashes) - len(np.unique(row_hashes)),
         }
 
-    def _analyze_data_types(self, df: pd.DataFrame) -> dict:
-        """Analyze column data types."""
-        type_mapping = {
-            "int64": "numeric",
-            "int32": "numeric",
-            "float64": "numeric",
-            "float32": "numeric",
-            "object": "text",
-            "bool": "boolean",
-            "datetime64[ns]": "datetime",
-            "category": "categorical",
-        }
+    def _infer_column_type(self, dtype_str: str, unique: int, rows: int) -> str:
+        """Map a pandas dtype to an EDA column type."""
+        inferred_type = DTYPE_CATEGORIES.get(dtype_str, "other")
 
-        columns = {}
-        for col in df.columns:
-            dtype_str = str(df[col].dtype)
-            inferred_type = type_mapping.get(dtype_str, "other")
+        # Check if text column might be categorical
+        if inferred_type == "text" and unique < rows * 0.1:
+            inferred_type = "categorical"
 
-            # Check if text column might be categorical
-            if inferred_type == "text" and df[col].nunique() < len(df) * 0.1:
-                inferred_type = "categorical"
-
-            columns[col] = {
-                "pandas_dtype": dtype_str,
-                "inferred_type": inferred_type,
-                "unique_values": df[col].nunique(),
-                "sample_values": df[col].dropna().head(3).tolist(),
-            }
+        return inferred_type
 
+    def _summarize_types(self, columns: dict) -> dict:
+        """Build the data-types report from per-column type info."""
         return {
             "columns": columns,
             "type_counts": {
@@ -285,89 +1044,225 @@ class DataLab:
             },
         }
 
+    def _analyze_data_types(self, df: pd.DataFrame) -> dict:
+        """Analyze column data types."""
+        columns = {}
+        for col in df.columns:
+            dtype_str = str(df[col].dtype)
+            unique = df[col].nunique()
+
+            columns[col] = {
+                "pandas_dtype": dtype_str,
+                "inferred_type": self._infer_column_type(dtype_str, unique, len(df)),
+                "unique_values": unique,
+                "sample_values": df[col].dropna().head(3).tolist(),
+            }
+
+        return self._summarize_types(columns)
+
     def _analyze_missing(self, df: pd.DataFrame) -> dict:
         """Analyze missing values."""
-        missing = df.isnull().sum()
-        missing_pct = (missing / len(df) * 100).round(2)
+        # Integer and boolean numpy columns cannot hold nulls, so only the
+        # remaining columns are scanned
+        can_be_null = np.array(
+            [
+                not (isinstance(dtype, np.dtype) and dtype.kind in "iub")
+                for dtype in df.dtypes
+            ],
+            dtype=bool,
+        )
+        missing = np.zeros(len(df.columns), dtype=np.int64)
+        if can_be_null.any():
+            missing[can_be_null] = df.iloc[:, can_be_null].isnull().sum().to_numpy()
+
+        return self._format_missing(pd.Series(missing, index=df.columns), len(df))
+
+    def _format_missing(self, missing: pd.Series, rows: int) -> dict:
+        """Build the missing-values report from per-column null counts."""
+        missing_pct = (missing / rows * 100).round(2)
 
         return {
             "total_missing": int(missing.sum()),
-            "total_missing_pct": round(
-                missing.sum() / (len(df) * len(df.columns)) * 100, 2
-            ),
+            "total_missing_pct": round(missing.sum() / (rows * len(missing)) * 100, 2),
             "by_column": {
                 col: {"count": int(missing[col]), "percentage": float(missing_pct[col])}
-                for col in df.columns
+                for col in missing.index
                 if missing[col] > 0
             },
         }
 
-    def _summarize_numeric(self, df: pd.DataFrame) -> dict:
+    def _summarize_numeric(
+        self, df: pd.DataFrame, numeric_cols: Optional[pd.Index] = None
+    ) -> dict:
         """Summarize numeric columns."""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) == 0:
             return {"columns": {}, "message": "No numeric columns found"}
 
+        # Materialise the numeric block once as a contiguous float matrix and
+        # reduce it column-wise, rather than going through pandas per column
+        values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        with warnings.catch_warnings():
+            # All-NaN columns reduce to NaN, as pandas reports them
+            warnings.simplefilter("ignore", RuntimeWarning)
+            counts = np.count_nonzero(~np.isnan(values), axis=0)
+            means = np.nanmean(values, axis=0)
+            stds = np.nanstd(values, axis=0, ddof=1)
+            mins = np.nanmin(values, axis=0)
+            maxs = np.nanmax(values, axis=0)
+            quartiles = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+
+            # Adjusted Fisher-Pearson skewness, matching DataFrame.skew()
+            deviations = values - means
+            m2 = np.nanmean(deviations**2, axis=0)
+            m3 = np.nanmean(deviations**3, axis=0)
+            skews = np.where(
+                m2 > 0,
+                m3
+                / np.where(m2 > 0, m2, 1.0) ** 1.5
+                * np.sqrt(counts * (counts - 1.0))
+                / (counts - 2.0),
+                0.0,
+            )
+
         summary = {}
-        for col in numeric_cols:
-            series = df[col].dropna()
+        for i, col in enumerate(numeric_cols):
+            count = int(counts[i])
             summary[col] = {
-                "count": len(series),
-                "mean": round(float(series.mean()), 4),
-                "std": round(float(series.std()), 4),
-                "min": float(series.min()),
-                "25%": float(series.quantile(0.25)),
-                "50%": float(series.median()),
-                "75%": float(series.quantile(0.75)),
-                "max": float(series.max()),
-                "skewness": round(float(series.skew()), 4) if len(series) > 2 else None,
+                "count": count,
+                "mean": round(float(means[i]), 4),
+                "std": round(float(stds[i]), 4),
+                "min": float(mins[i]),
+                "25%": float(quartiles[0, i]),
+                "50%": float(quartiles[1, i]),
+                "75%": float(quartiles[2, i]),
+                "max": float(maxs[i]),
+                "skewness": round(float(skews[i]), 4) if count > 2 else None,
             }
 
         return {"columns": summary}
 
-    def _summarize_categorical(self, df: pd.DataFrame) -> dict:
+    def _summarize_categorical(
+        self, df: pd.DataFrame, cat_cols: Optional[pd.Index] = None
+    ) -> dict:
         """Summarize categorical/text columns."""
-        cat_cols = df.select_dtypes(include=["object", "category"]).columns
+        if cat_cols is None:
+            cat_cols = df.select_dtypes(include=["object", "category"]).columns
         if len(cat_cols) == 0:
             return {"columns": {}, "message": "No categorical columns found"}
 
         summary = {}
         for col in cat_cols:
-            value_counts = df[col].value_counts()
-            summary[col] = {
-                "unique_values": df[col].nunique(),
-                "most_common": value_counts.head(5).to_dict(),
-                "least_common": value_counts.tail(3).to_dict()
-                if len(value_counts) > 5
-                else {},
-            }
+            summary[col] = self._describe_value_counts(df[col].value_counts(sort=False))
 
         return {"columns": summary}
 
-    def _analyze_correlations(self, df: pd.DataFrame) -> dict:
+    def _describe_value_counts(self, value_counts: pd.Series) -> dict:
+        """
+        Summarize a column from its (unsorted) value counts.
+
+        Picks the extremes with nlargest/nsmallest partial selection instead
+        of sorting every distinct value; least_common keeps the descending
+        order of the tail of a full sort.
+        """
+        return {
+            "unique_values": len(value_counts),
+            "most_common": value_counts.nlargest(5).to_dict(),
+            "least_common": value_counts.nsmallest(3, keep="last").iloc[::-1].to_dict()
+            if len(value_counts) > 5
+            else {},
+        }
+
+    def _analyze_correlations(
+        self, df: pd.DataFrame, numeric_cols: Optional[pd.Index] = None
+    ) -> dict:
         """Analyze correlations between numeric columns."""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) < 2:
             return {"matrix": {}, "message": "Need at least 2 numeric columns"}
 
-        corr_matrix = df[numeric_cols].corr()
+        return self._format_correlations(
+            self._correlation_matrix(df, numeric_cols.tolist())
+        )
+
+    def _correlated_pairs(self, corr_matrix: pd.DataFrame, threshold: float) -> list:
+        """
+        List (col1, col2, r) for upper-triangle pairs with |r| > threshold.
+
+        Scans the matrix with one vectorized mask over its upper triangle
+        instead of a label lookup per cell.
+        """
+        values = corr_matrix.to_numpy()
+        rows, cols = np.triu_indices_from(values, k=1)
+        pair_values = values[rows, cols]
+        mask = np.abs(pair_values) > threshold
+
+        labels = corr_matrix.columns
+        return [
+            (labels[i], labels[j], r)
+            for i, j, r in zip(rows[mask], cols[mask], pair_values[mask])
+        ]
+
+    def _correlation_matrix(
+        self, df: pd.DataFrame, cols: list, method: str = "pearson"
+    ) -> pd.DataFrame:
+        """
+        Compute df[cols].corr(), reusing the last matrix computed for the
+        same column content so EDA and correlation_analysis share it.
+
+        The key hashes the columns' values, so edits to the frame in place
+        are never served a stale matrix.
+        """
+        key = (self._frame_digest(df[cols]), tuple(cols), method)
+        with self._corr_lock:
+            cached = self._corr_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        matrix = None
+        if CUPY_AVAILABLE and method == "pearson" and len(cols) >= GPU_CORR_MIN_COLUMNS:
+            matrix = self._gpu_correlation_matrix(df, cols)
+        if matrix is None:
+            matrix = df[cols].corr(method=method)
+
+        with self._corr_lock:
+            self._corr_cache = (key, matrix)
+        return matrix
+
+    def _gpu_correlation_matrix(
+        self, df: pd.DataFrame, cols: list
+    ) -> Optional[pd.DataFrame]:
+        """
+        Compute a Pearson matrix with CuPy for wide frames.
+
+        Returns None (so pandas is used) when the block has missing values,
+        since corrcoef cannot do pandas' pairwise-complete handling, or when
+        the GPU is unavailable.
+        """
+        try:
+            values = df[cols].to_numpy(dtype=np.float64)
+            if np.isnan(values).any():
+                return None
+
+            corr = cupy.corrcoef(cupy.asarray(values), rowvar=False).get()
+            return pd.DataFrame(corr, index=cols, columns=cols)
+        except Exception:
+            return None
 
+    def _format_correlations(self, corr_matrix: pd.DataFrame) -> dict:
+        """Build the correlations report from a correlation matrix."""
         # Find strong correlations
-        strong_correlations = []
-        for i, col1 in enumerate(numeric_cols):
-            for col2 in numeric_cols[i + 1 :]:
-                corr_value = corr_matrix.loc[col1, col2]
-                if abs(corr_value) > 0.5:
-                    strong_correlations.append(
-                        {
-                            "column_1": col1,
-                            "column_2": col2,
-                            "correlation": round(corr_value, 4),
-                            "strength": "strong"
-                            if abs(corr_value) > 0.7
-                            else "moderate",
-                        }
-                    )
+        strong_correlations = [
+            {
+                "column_1": col1,
+                "column_2": col2,
+                "correlation": round(corr_value, 4),
+                "strength": "strong" if abs(corr_value) > 0.7 else "moderate",
+            }
+            for col1, col2, corr_value in self._correlated_pairs(corr_matrix, 0.5)
+        ]
 
         return {
             "matrix": corr_matrix.round(4).to_dict(),
@@ -378,13 +1273,65 @@ class DataLab:
     # SENTIMENT ANALYSIS
     # =========================================================================
 
+    def _load_onnx_sentiment_model(self):
+        """
+        Load the sentiment model as an int8-quantized ONNX Runtime model.
+
+        The model is exported and dynamically quantized on first use, then
+        reloaded from ONNX_MODEL_DIR on subsequent runs. The session runs
+        each call single-threaded so concurrent batches don't oversubscribe
+        the cores.
+
+        Returns:
+            (InferenceSession, tokenizer, id2label) tuple
+        """
+        quantized_file = "model_quantized.onnx"
+        if not (ONNX_MODEL_DIR / quantized_file).exists():
+            model = ORTModelForSequenceClassification.from_pretrained(
+                SENTIMENT_MODEL, export=True
+            )
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=ONNX_MODEL_DIR,
+                quantization_config=AutoQuantizationConfig.avx2(
+                    is_static=False, per_channel=False
+                ),
+            )
+            AutoTokenizer.from_pretrained(SENTIMENT_MODEL).save_pretrained(
+                ONNX_MODEL_DIR
+            )
+            model.config.save_pretrained(ONNX_MODEL_DIR)
+
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = 1
+        session = ort.InferenceSession(
+            str(ONNX_MODEL_DIR / quantized_file),
+            sess_options=session_options,
+            providers=["CPUExecutionProvider"],
+        )
+        tokenizer = AutoTokenizer.from_pretrained(ONNX_MODEL_DIR)
+        labels = AutoConfig.from_pretrained(ONNX_MODEL_DIR).id2label
+        return session, tokenizer, labels
+
     def _get_sentiment_pipeline(self):
         """Get or create sentiment analysis pipeline."""
         if self._sentiment_pipeline is None and TRANSFORMERS_AVAILABLE:
+            if ONNX_AVAILABLE:
+                try:
+                    self._sentiment_pipeline = _OnnxSentimentScorer(
+                        *self._load_onnx_sentiment_model()
+                    )
+                    # ONNX Runtime releases the GIL, so batches can run in threads
+                    self._sentiment_workers = os.cpu_count() or 1
+                    return self._sentiment_pipeline
+                except Exception:
+                    # Fall through to the PyTorch model
+                    self._sentiment_pipeline = None
+
             try:
                 self._sentiment_pipeline = pipeline(
                     "sentiment-analysis",
-                    model="cardiffnlp/twitter-roberta-base-sentiment-latest",
+                    model=SENTIMENT_MODEL,
                     top_k=None,
                 )
             except Exception:
@@ -423,56 +1370,15 @@ class DataLab:
             return self._simple_sentiment_analysis(texts)
 
         try:
-            # Process in batches
-            results = []
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-                # Truncate long texts
-                batch = [t[:512] if len(t) > 512 else t for t in batch]
-                batch_results = sentiment_pipe(batch)
-                results.extend(batch_results)
-
-            # Aggregate results
-            sentiments = []
-            for result in results:
-                if isinstance(result, list):
-                    # Multiple labels returned
-                    top_label = max(result, key=lambda x: x["score"])
-                else:
-                    top_label = result
-
-                sentiments.append(
-                    {"label": top_label["label"], "score": round(top_label["score"], 4)}
-                )
-
-            # Calculate distribution
-            label_counts = {}
-            for s in sentiments:
-                label = s["label"].upper()
-                if "POS" in label or label == "POSITIVE":
-                    normalized = "positive"
-                elif "NEG" in label or label == "NEGATIVE":
-                    normalized = "negative"
-                else:
-                    normalized = "neutral"
-
-                label_counts[normalized] = label_counts.get(normalized, 0) + 1
-
-            total = len(sentiments)
-            distribution = {
-                k: {"count": v, "percentage": round(v / total * 100, 2)}
-                for k, v in label_counts.items()
-            }
-
-            # Calculate average sentiment score
-            avg_score = np.mean([s["score"] for s in sentiments])
+            sentiments = self._score_texts(sentiment_pipe, texts, batch_size)
+            codes, scores = self._model_label_codes(sentiments)
 
             return {
                 "status": "success",
                 "timestamp": datetime.now().isoformat(),
-                "total_analyzed": total,
-                "distribution": distribution,
-                "average_confidence": round(float(avg_score), 4),
+                "total_analyzed": len(sentiments),
+                "distribution": self._sentiment_distribution(codes),
+                "average_confidence": round(float(scores.mean()), 4),
                 "detailed_results": sentiments[:100],  # Limit detailed output
                 "model": "cardiffnlp/twitter-roberta-base-sentiment",
             }
@@ -480,82 +1386,177 @@ class DataLab:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-    def _simple_sentiment_analysis(self, texts: list) -> dict:
-        """Simple rule-based sentiment analysis fallback."""
-        positive_words = {
-            "good",
-            "great",
-            "excellent",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "love",
-            "best",
-            "perfect",
-            "beautiful",
-            "friendly",
-            "helpful",
-            "recommend",
-            "delicious",
-            "outstanding",
-            "superb",
-            "lovely",
-        }
-        negative_words = {
-            "bad",
-            "terrible",
-            "awful",
-            "horrible",
-            "worst",
-            "poor",
-            "hate",
-            "disappointed",
-            "disgusting",
-            "rude",
-            "dirty",
-            "slow",
-            "cold",
-            "overpriced",
-            "avoid",
-            "never",
+    def _score_texts(self, sentiment_pipe, texts: list, batch_size: int) -> list:
+        """
+        Get the top sentiment label for each text.
+
+        Texts are keyed by a hash of their truncated content, so duplicate
+        reviews and texts already scored by this DataLab skip the model.
+        Unseen texts run in length-sorted batches so each batch pads to a
+        similar length; with the ONNX model, batches are tokenized in order
+        and their inference runs concurrently.
+        """
+        # Truncate long texts
+        texts = [t[:512] for t in texts]
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+
+        resolved = {}
+        pending = {}
+        with self._sentiment_lock:
+            for key, text in zip(keys, texts):
+                if key in resolved or key in pending:
+                    continue
+                cached = self._sentiment_cache.get(key)
+                if cached is not None:
+                    self._sentiment_cache.move_to_end(key)
+                    resolved[key] = cached
+                else:
+                    pending[key] = text
+
+        pending_keys = list(pending)
+        pending_texts = list(pending.values())
+        order = sorted(range(len(pending_texts)), key=lambda i: len(pending_texts[i]))
+        batches = [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+        def scored_batches():
+            tokenize = getattr(sentiment_pipe, "tokenize", None)
+            if tokenize is None or self._sentiment_workers <= 1:
+                for indices in batches:
+                    batch = [pending_texts[j] for j in indices]
+                    yield indices, sentiment_pipe(batch, batch_size=len(batch))
+                return
+
+            # Tokenize on this thread, since a fast tokenizer must not be
+            # shared between threads, and run only the thread-safe ONNX
+            # session in the pool, keeping a bounded number of batches queued
+            max_in_flight = 2 * self._sentiment_workers
+            with ThreadPoolExecutor(max_workers=self._sentiment_workers) as executor:
+                in_flight = deque()
+                for indices in batches:
+                    inputs = tokenize([pending_texts[j] for j in indices])
+                    in_flight.append(
+                        (indices, executor.submit(sentiment_pipe.run, inputs))
+                    )
+                    if len(in_flight) >= max_in_flight:
+                        done, future = in_flight.popleft()
+                        yield done, future.result()
+                while in_flight:
+                    done, future = in_flight.popleft()
+                    yield done, future.result()
+
+        for indices, batch_results in scored_batches():
+            for j, result in zip(indices, batch_results):
+                if isinstance(result, list):
+                    # Multiple labels returned
+                    top_label = max(result, key=lambda x: x["score"])
+                else:
+                    top_label = result
+
+                sentiment = {
+                    "label": top_label["label"],
+                    "score": round(top_label["score"], 4),
+                }
+                resolved[pending_keys[j]] = sentiment
+
+        with self._sentiment_lock:
+            for key in pending_keys:
+                self._sentiment_cache[key] = resolved[key]
+            while len(self._sentiment_cache) > SENTIMENT_CACHE_SIZE:
+                self._sentiment_cache.popitem(last=False)
+
+        return [resolved[key] for key in keys]
+
+    def _normalize_sentiment_label(self, label: str) -> str:
+        """Map a model label to positive/negative/neutral."""
+        label = label.upper()
+        if "POS" in label or label == "POSITIVE":
+            return "positive"
+        elif "NEG" in label or label == "NEGATIVE":
+            return "negative"
+        return "neutral"
+
+    def _model_label_codes(self, sentiments: list) -> tuple:
+        """
+        Convert model results to label codes and scores.
+
+        Returns:
+            (codes, scores) arrays, codes indexing SENTIMENT_LABELS
+        """
+        # Models emit only a handful of raw labels, so normalize each once
+        lookup = {
+            label: SENTIMENT_LABELS.index(self._normalize_sentiment_label(label))
+            for label in {s["label"] for s in sentiments}
         }
+        codes = np.fromiter(
+            (lookup[s["label"]] for s in sentiments),
+            dtype=np.intp,
+            count=len(sentiments),
+        )
+        scores = np.fromiter(
+            (s["score"] for s in sentiments), dtype=np.float64, count=len(sentiments)
+        )
+        return codes, scores
+
+    def _sentiment_distribution(
+        self, codes: np.ndarray, keep_empty: bool = False
+    ) -> dict:
+        """Count label codes into a label -> count/percentage distribution."""
+        total = len(codes)
+        distribution = {}
+        for label, count in zip(
+            SENTIMENT_LABELS, np.bincount(codes, minlength=len(SENTIMENT_LABELS))
+        ):
+            if count or keep_empty:
+                count = int(count)
+                distribution[label] = {
+                    "count": count,
+                    "percentage": round(count / total * 100, 2),
+                }
+        return distribution
 
-        results = []
-        for text in texts:
-            words = set(text.lower().split())
-            pos_count = len(words & positive_words)
-            neg_count = len(words & negative_words)
-
-            if pos_count > neg_count:
-                label = "positive"
-                score = min(0.5 + pos_count * 0.1, 0.95)
-            elif neg_count > pos_count:
-                label = "negative"
-                score = min(0.5 + neg_count * 0.1, 0.95)
-            else:
-                label = "neutral"
-                score = 0.5
+    def _rule_based_scores(self, texts: list) -> tuple:
+        """
+        Label texts with the rule-based lexicons.
 
-            results.append({"label": label, "score": score})
+        Each text is lowercased and stripped of punctuation with a single
+        str.translate, then matched against the frozenset lexicons; only the
+        per-text counts are kept, so no token set is built for the text.
 
-        # Calculate distribution
-        label_counts = {"positive": 0, "negative": 0, "neutral": 0}
-        for r in results:
-            label_counts[r["label"]] += 1
+        Returns:
+            (codes, scores) arrays aligned with texts, codes indexing
+            SENTIMENT_LABELS
+        """
+        pos_counts = np.empty(len(texts))
+        neg_counts = np.empty(len(texts))
+        for i, text in enumerate(texts):
+            words = text.lower().translate(_PUNCTUATION_TABLE).split()
+            pos_counts[i] = len(POSITIVE_WORDS.intersection(words))
+            neg_counts[i] = len(NEGATIVE_WORDS.intersection(words))
+
+        codes = np.where(
+            pos_counts > neg_counts, 0, np.where(neg_counts > pos_counts, 1, 2)
+        )
+        scores = np.where(
+            codes == 2,
+            0.5,
+            np.minimum(0.5 + np.maximum(pos_counts, neg_counts) * 0.1, 0.95),
+        )
+        return codes, scores
 
-        total = len(results)
-        distribution = {
-            k: {"count": v, "percentage": round(v / total * 100, 2)}
-            for k, v in label_counts.items()
-        }
+    def _simple_sentiment_analysis(self, texts: list) -> dict:
+        """Simple rule-based sentiment analysis fallback."""
+        codes, scores = self._rule_based_scores(texts)
 
         return {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
-            "total_analyzed": total,
-            "distribution": distribution,
-            "average_confidence": round(np.mean([r["score"] for r in results]), 4),
-            "detailed_results": results[:100],
+            "total_analyzed": len(texts),
+            "distribution": self._sentiment_distribution(codes, keep_empty=True),
+            "average_confidence": round(float(scores.mean()), 4),
+            "detailed_results": [
+                {"label": SENTIMENT_LABELS[code], "score": score}
+                for code, score in zip(codes[:100].tolist(), scores[:100].tolist())
+            ],
             "model": "rule-based (fallback)",
         }
 
@@ -576,18 +1577,40 @@ class DataLab:
         if text_column not in df.columns or category_column not in df.columns:
             return {"status": "error", "error": "Required columns not found"}
 
-        categories = df[category_column].dropna().unique()
+        # Score every text in one model pass, then split by category
+        rows = df[df[category_column].notna()]
+        has_text = rows[text_column].notna()
+        texts = rows.loc[has_text, text_column].tolist()
         results = {}
 
-        for cat in categories:
-            cat_df = df[df[category_column] == cat]
-            sentiment_result = self.analyze_sentiment(cat_df, text_column)
+        if texts:
+            sentiment_pipe = self._get_sentiment_pipeline()
+            try:
+                if sentiment_pipe is None:
+                    codes, scores = self._rule_based_scores(texts)
+                else:
+                    sentiments = self._score_texts(sentiment_pipe, texts, 32)
+                    codes, scores = self._model_label_codes(sentiments)
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
+
+            scored = pd.DataFrame(
+                {
+                    "category": rows.loc[has_text, category_column].to_numpy(),
+                    "code": codes,
+                    "score": scores,
+                }
+            )
+            row_counts = rows[category_column].value_counts(sort=False)
 
-            if sentiment_result.get("status") == "success":
+            for cat, group in scored.groupby("category", sort=False):
                 results[str(cat)] = {
-                    "count": len(cat_df),
-                    "distribution": sentiment_result.get("distribution", {}),
-                    "avg_confidence": sentiment_result.get("average_confidence", 0),
+                    "count": int(row_counts[cat]),
+                    # The rule-based fallback reports every label
+                    "distribution": self._sentiment_distribution(
+                        group["code"].to_numpy(), keep_empty=sentiment_pipe is None
+                    ),
+                    "avg_confidence": round(float(group["score"].mean()), 4),
                 }
 
         return {
@@ -674,23 +1697,23 @@ class DataLab:
         if len(cols) < 2:
             return {"status": "error", "error": "Need at least 2 numeric columns"}
 
-        corr_matrix = df[cols].corr(method=method)
-
-        # Find significant correlations
-        significant = []
-        for i, col1 in enumerate(cols):
-            for col2 in cols[i + 1 :]:
-                r = corr_matrix.loc[col1, col2]
-                if abs(r) > 0.3:  # Threshold for significance
-                    significant.append(
-                        {
-                            "var1": col1,
-                            "var2": col2,
-                            "r": round(r, 4),
-                            "r_squared": round(r**2, 4),
-                            "interpretation": self._interpret_correlation(r),
-                        }
-                    )
+        corr_matrix = self._correlation_matrix(df, cols, method)
+
+        # Find significant correlations (|r| > 0.3)
+        pairs = self._correlated_pairs(corr_matrix, 0.3)
+        interpretations = self._interpret_correlations(
+            np.array([r for _, _, r in pairs], dtype=np.float64)
+        )
+        significant = [
+            {
+                "var1": col1,
+                "var2": col2,
+                "r": round(r, 4),
+                "r_squared": round(r**2, 4),
+                "interpretation": interpretation,
+            }
+            for (col1, col2, r), interpretation in zip(pairs, interpretations)
+        ]
 
         return {
             "status": "success",
@@ -704,19 +1727,14 @@ class DataLab:
 
     def _interpret_correlation(self, r: float) -> str:
         """Interpret correlation coefficient."""
-        abs_r = abs(r)
-        direction = "positive" if r > 0 else "negative"
-
-        if abs_r < 0.1:
-            return "negligible"
-        elif abs_r < 0.3:
-            return f"weak {direction}"
-        elif abs_r < 0.5:
-            return f"moderate {direction}"
-        elif abs_r < 0.7:
-            return f"strong {direction}"
-        else:
-            return f"very strong {direction}"
+        return self._interpret_correlations(np.array([r], dtype=np.float64))[0]
+
+    def _interpret_correlations(self, r: np.ndarray) -> list:
+        """Interpret an array of correlation coefficients in one lookup."""
+        band = np.searchsorted(CORRELATION_THRESHOLDS, np.abs(r), side="right")
+        return np.where(
+            r > 0, POSITIVE_CORRELATION_LABELS[band], NEGATIVE_CORRELATION_LABELS[band]
+        ).tolist()
 
     def significance_test(self, df: pd.DataFrame, test_type: str, **kwargs) -> dict:
         """
@@ -757,18 +1775,17 @@ class DataLab:
         group_column: str = None,
         value1: float = None,
         paired: bool = False,
+        equal_var: bool = False,
     ) -> dict:
-        """Independent or one-sample t-test."""
+        """Independent (Welch's unless equal_var) or one-sample t-test."""
         if group_column and group_column in df.columns:
             # Independent samples t-test
-            groups = df[group_column].dropna().unique()
+            groups, group_data = self._split_by_group(df, column, group_column)
             if len(groups) != 2:
                 return {"status": "error", "error": "Need exactly 2 groups for t-test"}
 
-            group1 = df[df[group_column] == groups[0]][column].dropna()
-            group2 = df[df[group_column] == groups[1]][column].dropna()
-
-            t_stat, p_value = stats.ttest_ind(group1, group2)
+            group1, group2 = group_data
+            t_stat, p_value = stats.ttest_ind(group1, group2, equal_var=equal_var)
 
             return {
                 "status": "success",
@@ -785,7 +1802,8 @@ class DataLab:
             }
         else:
             # One-sample t-test
-            sample = df[column].dropna()
+            sample = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            sample = sample[~np.isnan(sample)]
             test_value = value1 or 0
 
             t_stat, p_value = stats.ttest_1samp(sample, test_value)
@@ -823,8 +1841,7 @@ class DataLab:
         self, df: pd.DataFrame, value_column: str, group_column: str
     ) -> dict:
         """One-way ANOVA test."""
-        groups = df[group_column].dropna().unique()
-        group_data = [df[df[group_column] == g][value_column].dropna() for g in groups]
+        groups, group_data = self._split_by_group(df, value_column, group_column)
 
         f_stat, p_value = stats.f_oneway(*group_data)
 
@@ -838,22 +1855,28 @@ class DataLab:
             "significant": p_value < 0.05,
             "interpretation": self._interpret_p_value(p_value),
             "group_means": {
-                str(g): round(float(df[df[group_column] == g][value_column].mean()), 4)
-                for g in groups
+                str(g): round(float(values.mean()), 4) if len(values) else float("nan")
+                for g, values in zip(groups, group_data)
             },
         }
 
     def _mann_whitney_test(
-        self, df: pd.DataFrame, column: str, group_column: str
+        self, df: pd.DataFrame, column: Union[str, list], group_column: str
     ) -> dict:
-        """Mann-Whitney U test (non-parametric alternative to t-test)."""
-        groups = df[group_column].dropna().unique()
+        """
+        Mann-Whitney U test (non-parametric alternative to t-test).
+
+        Given a list of columns, tests them all in one call along axis 0 and
+        returns a result per column under "columns".
+        """
+        if not isinstance(column, str):
+            return self._mann_whitney_columns(df, list(column), group_column)
+
+        groups, group_data = self._split_by_group(df, column, group_column)
         if len(groups) != 2:
             return {"status": "error", "error": "Need exactly 2 groups"}
 
-        group1 = df[df[group_column] == groups[0]][column].dropna()
-        group2 = df[df[group_column] == groups[1]][column].dropna()
-
+        group1, group2 = group_data
         u_stat, p_value = stats.mannwhitneyu(group1, group2, alternative="two-sided")
 
         return {
@@ -868,6 +1891,61 @@ class DataLab:
             "interpretation": self._interpret_p_value(p_value),
         }
 
+    def _mann_whitney_columns(
+        self, df: pd.DataFrame, columns: list, group_column: str
+    ) -> dict:
+        """Mann-Whitney U tests of several columns between the same 2 groups."""
+        codes, groups = pd.factorize(df[group_column])
+        if len(groups) != 2:
+            return {"status": "error", "error": "Need exactly 2 groups"}
+
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        group1, group2 = values[codes == 0], values[codes == 1]
+        # NaNs are omitted per column, as dropna() does for a single column
+        u_stats, p_values = stats.mannwhitneyu(
+            group1, group2, alternative="two-sided", axis=0, nan_policy="omit"
+        )
+        n1 = np.count_nonzero(~np.isnan(group1), axis=0)
+        n2 = np.count_nonzero(~np.isnan(group2), axis=0)
+
+        return {
+            "status": "success",
+            "test": "mann_whitney_u",
+            "groups": [str(groups[0]), str(groups[1])],
+            "columns": {
+                col: {
+                    "n1": int(n1[i]),
+                    "n2": int(n2[i]),
+                    "u_statistic": round(float(u_stats[i]), 4),
+                    "p_value": round(float(p_values[i]), 6),
+                    "significant": bool(p_values[i] < 0.05),
+                    "interpretation": self._interpret_p_value(p_values[i]),
+                }
+                for i, col in enumerate(columns)
+            },
+        }
+
+    def _split_by_group(
+        self, df: pd.DataFrame, value_column: str, group_column: str
+    ) -> tuple:
+        """
+        Split a column's non-null values by group as float arrays.
+
+        Groups are factorized once and the values sorted by group code, so
+        each group is a slice rather than a separate boolean-mask pass.
+
+        Returns:
+            (groups, arrays) with groups in order of first appearance
+        """
+        codes, groups = pd.factorize(df[group_column])
+        values = df[value_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        keep = (codes >= 0) & ~np.isnan(values)
+        codes, values = codes[keep], values[keep]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(groups)))[:-1]
+        return groups, np.split(values[order], bounds)
+
     def _interpret_p_value(self, p: float) -> str:
         """Interpret p-value for thesis writing."""
         if p < 0.001:
@@ -903,6 +1981,81 @@ class DataLab:
                 "error": "plotly not available for visualization",
             }
 
+        # Figures are always built fresh: a cached figure's JSON would come
+        # back with its arrays as base64 {"dtype", "bdata"} blobs
+        result = self._build_chart(df, chart_type, kwargs)
+        if result["status"] != "success":
+            return result
+        return {
+            "status": "success",
+            "chart_type": chart_type,
+            "figure": result["figure"],
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def _chart_json(
+        self,
+        df: pd.DataFrame,
+        chart_type: str,
+        kwargs: dict,
+        frame_digest: Optional[str] = None,
+    ) -> dict:
+        """
+        Build a chart as compact Plotly JSON, reusing the JSON cached for the
+        same data, chart type and options.
+
+        Pass frame_digest when drawing several charts from one frame so it is
+        hashed once; cache hits return only "figure_json", never a Figure.
+        Options holding arrays or other objects are not cached, since numpy
+        and pandas abbreviate their reprs and distinct values would collide.
+        """
+        cache_key = None
+        if all(_is_plain_option(value) for value in kwargs.values()):
+            try:
+                cache_key = (
+                    frame_digest or self._frame_digest(df),
+                    chart_type,
+                    repr(sorted(kwargs.items())),
+                )
+            except TypeError:
+                # Unhashable cell values (e.g. lists); build without caching
+                pass
+
+        cached = None
+        if cache_key is not None:
+            with self._chart_lock:
+                cached = self._chart_cache.get(cache_key)
+                if cached is not None:
+                    self._chart_cache.move_to_end(cache_key)
+        if cached is not None:
+            return {
+                "status": "success",
+                "chart_type": chart_type,
+                "figure_json": cached,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        result = self._build_chart(df, chart_type, kwargs)
+        if result["status"] != "success":
+            return result
+
+        figure_json = self._figure_json(result["figure"])
+        if cache_key is not None:
+            with self._chart_lock:
+                self._chart_cache[cache_key] = figure_json
+                while len(self._chart_cache) > CHART_CACHE_SIZE:
+                    self._chart_cache.popitem(last=False)
+
+        return {
+            "status": "success",
+            "chart_type": chart_type,
+            "figure": result["figure"],
+            "figure_json": figure_json,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def _build_chart(self, df: pd.DataFrame, chart_type: str, kwargs: dict) -> dict:
+        """Draw a chart as a Figure, returning {"status", "figure"} or an error."""
         try:
             if chart_type == "histogram":
                 fig = px.histogram(df, **kwargs)
@@ -917,15 +2070,16 @@ class DataLab:
                 x = kwargs.get("x")
                 y = kwargs.get("y")
                 if x and y:
-                    corr = df[[x, y]].corr()
+                    numeric = df[[x, y]]
                 else:
-                    corr = df.select_dtypes(include=[np.number]).corr()
+                    numeric = df.select_dtypes(include=[np.number])
+                corr, labels = self._heatmap_correlation(numeric)
 
                 fig = go.Figure(
                     data=go.Heatmap(
-                        z=corr.values,
-                        x=corr.columns,
-                        y=corr.index,
+                        z=corr,
+                        x=labels,
+                        y=labels,
                         colorscale="RdBu_r",
                         zmin=-1,
                         zmax=1,
@@ -944,16 +2098,46 @@ class DataLab:
                 template="plotly_white", font=dict(family="Inter, sans-serif")
             )
 
-            return {
-                "status": "success",
-                "chart_type": chart_type,
-                "figure": fig,
-                "timestamp": datetime.now().isoformat(),
-            }
+            return {"status": "success", "figure": fig}
 
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def _heatmap_correlation(self, numeric: pd.DataFrame) -> tuple:
+        """
+        Pearson correlation matrix of a numeric frame as an ndarray.
+
+        Constant and empty columns are left out, since they only correlate
+        as NaN. Complete data is centered once and its Gram matrix taken as
+        centered.T @ centered, which BLAS computes as a symmetric rank-k
+        update over one triangle; frames with missing values keep pandas'
+        pairwise-complete handling.
+
+        Returns:
+            (matrix, column labels)
+        """
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                numeric = numeric.iloc[:, np.nanstd(values, axis=0) > 0]
+            return numeric.corr().to_numpy(), numeric.columns
+
+        if len(values) < 2:
+            return np.empty((0, 0)), numeric.columns[:0]
+
+        varying = np.ptp(values, axis=0) > 0
+        centered = values - values.mean(axis=0)
+        # Slicing the small Gram matrix is cheaper than copying the columns
+        gram = (centered.T @ centered)[np.ix_(varying, varying)]
+        norms = np.sqrt(np.diag(gram))
+        upper = np.triu(gram / np.outer(norms, norms), k=1)
+
+        # Mirror the upper triangle so the matrix is exactly symmetric
+        corr = upper + upper.T
+        np.fill_diagonal(corr, 1.0)
+        return corr, numeric.columns[varying]
+
     def create_dashboard_figures(self, df: pd.DataFrame) -> dict:
         """
         Auto-generate appropriate visualizations based on data types.
@@ -962,7 +2146,8 @@ class DataLab:
             df: DataFrame to visualize
 
         Returns:
-            dict with multiple chart figures
+            dict with multiple chart figures as compact Plotly JSON strings
+            (load with plotly.io.from_json), so no Figure objects are kept
         """
         if not PLOTLY_AVAILABLE:
             return {"status": "error", "error": "plotly not available"}
@@ -973,14 +2158,22 @@ class DataLab:
             include=["object", "category"]
         ).columns.tolist()
 
-        # Histograms for numeric columns
+        # Histograms for numeric columns, hashing the frame once for all
+        digest = self._frame_digest(df) if numeric_cols else None
         for col in numeric_cols[:3]:
-            result = self.generate_chart(
-                df, "histogram", x=col, title=f"Distribution of {col}"
+            result = self._chart_json(
+                df,
+                "histogram",
+                {"x": col, "title": f"Distribution of {col}"},
+                frame_digest=digest,
             )
             if result.get("status") == "success":
                 figures.append(
-                    {"type": "histogram", "column": col, "figure": result["figure"]}
+                    {
+                        "type": "histogram",
+                        "column": col,
+                        "figure_json": result["figure_json"],
+                    }
                 )
 
         # Bar charts for categorical columns
@@ -988,25 +2181,31 @@ class DataLab:
             if df[col].nunique() <= 20:
                 counts = df[col].value_counts().reset_index()
                 counts.columns = [col, "count"]
-                result = self.generate_chart(
-                    counts, "bar", x=col, y="count", title=f"Frequency of {col}"
+                result = self._chart_json(
+                    counts,
+                    "bar",
+                    {"x": col, "y": "count", "title": f"Frequency of {col}"},
                 )
                 if result.get("status") == "success":
                     figures.append(
-                        {"type": "bar", "column": col, "figure": result["figure"]}
+                        {
+                            "type": "bar",
+                            "column": col,
+                            "figure_json": result["figure_json"],
+                        }
                     )
 
         # Correlation heatmap if enough numeric columns
         if len(numeric_cols) >= 2:
-            result = self.generate_chart(
-                df[numeric_cols], "heatmap", title="Correlation Matrix"
+            result = self._chart_json(
+                df[numeric_cols], "heatmap", {"title": "Correlation Matrix"}
             )
             if result.get("status") == "success":
                 figures.append(
                     {
                         "type": "heatmap",
                         "column": "correlations",
-                        "figure": result["figure"],
+                        "figure_json": result["figure_json"],
                     }
                 )
 
@@ -1016,6 +2215,10 @@ class DataLab:
             "figures": figures,
         }
 
+    def _figure_json(self, fig) -> str:
+        """Serialize a figure to compact JSON (via orjson when installed)."""
+        return pio.to_json(fig, validate=False, pretty=False)
+
     # =========================================================================
     # NARRATIVE EXPORT
     # =========================================================================
@@ -1035,36 +2238,83 @@ class DataLab:
         Returns:
             dict with generated narrative text
         """
-        if not self._llm_available:
-            return {"status": "error", "error": "LLM gateway not available"}
+        return self.generate_analysis_narratives(
+            [{"analysis_results": analysis_results, "section_type": section_type}]
+        )[0]
 
-        # Prepare analysis summary for LLM
-        summary = json.dumps(analysis_results, indent=2, default=str)[:4000]
+    def generate_analysis_narratives(self, items: list) -> list:
+        """
+        Generate narratives for several analyses at once.
 
-        prompt = f"""You are a PhD research assistant helping write a thesis.
+        The LLM requests are issued concurrently, so a report asking for
+        findings, discussion and methodology text waits for the slowest
+        response rather than the sum of all of them.
 
-Convert the following statistical analysis results into academic prose suitable for a {section_type} section.
+        Args:
+            items: dicts with "analysis_results" and optional "section_type"
 
-Requirements:
-- Use formal academic language
-- Report statistics correctly (e.g., "t(df) = X.XX, p < .05")
-- Interpret findings in context
-- Use hedging language appropriately (e.g., "suggests", "indicates")
-- Keep the narrative concise but thorough
+        Returns:
+            list of narrative result dicts, in the order of items
+        """
+        if not self._llm_available:
+            return [
+                {"status": "error", "error": "LLM gateway not available"} for _ in items
+            ]
+        if not items:
+            return []
+
+        # The same results are often narrated for several sections
+        summaries = {}
+        requests = []
+        for item in items:
+            section_type = item.get("section_type", "findings")
+            results = item["analysis_results"]
+            if id(results) not in summaries:
+                summaries[id(results)] = self._narrative_summary(results)
+            prompt = NARRATIVE_PROMPT_TEMPLATE.format(
+                section_type=section_type, summary=summaries[id(results)]
+            )
+            requests.append((prompt, section_type))
 
-Analysis Results:
-{summary}
+            # Log from this thread so ledger writes stay sequential; a ledger
+            # failure must not discard the narratives themselves
+            try:
+                log_ai_usage(
+                    action_type="narrative_generation",
+                    data_source="data_lab_analysis",
+                    prompt=prompt[:200],
+                    was_scrubbed=False,
+                )
+            except Exception as e:
+                logger.warning("Could not log narrative request to AI ledger: %s", e)
 
-Write 2-3 paragraphs of thesis-ready text:"""
+        with ThreadPoolExecutor(
+            max_workers=min(len(requests), NARRATIVE_MAX_CONCURRENCY)
+        ) as executor:
+            return list(executor.map(lambda r: self._request_narrative(*r), requests))
 
-        try:
-            log_ai_usage(
-                action_type="narrative_generation",
-                data_source="data_lab_analysis",
-                prompt=prompt[:200],
-                was_scrubbed=False,
-            )
+    def _narrative_summary(self, analysis_results: dict) -> str:
+        """
+        Serialize analysis results for a prompt, truncated to
+        NARRATIVE_SUMMARY_CHARS.
 
+        Encodes incrementally and stops once enough text is produced, so
+        large reports (e.g. full correlation matrices) aren't serialized
+        only to be cut off.
+        """
+        encoder = json.JSONEncoder(indent=2, default=str)
+        chunks = []
+        length = 0
+        for chunk in encoder.iterencode(analysis_results):
+            chunks.append(chunk)
+            length += len(chunk)
+            if length >= NARRATIVE_SUMMARY_CHARS:
+                break
+        return "".join(chunks)[:NARRATIVE_SUMMARY_CHARS]
+
+    def _request_narrative(self, prompt: str, section_type: str) -> dict:
+        """Send one narrative prompt to the LLM gateway."""
+        try:
             result = self._llm_gateway.generate_content(
                 prompt=prompt, task_type="drafting"
             )
@@ -1085,6 +2335,17 @@ Write 2-3 paragraphs of thesis-ready text:"""
 # STANDALONE FUNCTIONS
 # =============================================================================
 
+# Global Data Lab instance
+_data_lab = None
+
+
+def get_data_lab() -> DataLab:
+    """Get or create the global Data Lab instance shared by these functions."""
+    global _data_lab
+    if _data_lab is None:
+        _data_lab = DataLab()
+    return _data_lab
+
 
 def load_data(source: str, source_type: str = "csv", **kwargs) -> dict:
     """
@@ -1094,7 +2355,7 @@ def load_data(source: str, source_type: str = "csv", **kwargs) -> dict:
         from core.data_lab import load_data
         result = load_data("data.csv", source_type="csv")
     """
-    lab = DataLab()
+    lab = get_data_lab()
     if source_type == "csv":
         return lab.load_csv(source, **kwargs)
     elif source_type == "excel":
@@ -1115,12 +2376,16 @@ def run_full_analysis(
         from core.data_lab import run_full_analysis
         result = run_full_analysis(df, include_sentiment=True, text_column="review")
     """
-    lab = DataLab()
+    lab = get_data_lab()
+
+    # Classify the columns once and share it across the analyses
+    column_types = lab._column_types(df)
+    numeric_cols = column_types[0].tolist()
 
     results = {
-        "eda": lab.run_eda(df),
-        "descriptive_stats": lab.descriptive_statistics(df),
-        "correlations": lab.correlation_analysis(df),
+        "eda": lab.run_eda(df, column_types=column_types),
+        "descriptive_stats": lab.descriptive_statistics(df, columns=numeric_cols),
+        "correlations": lab.correlation_analysis(df, columns=numeric_cols),
     }
 
     if include_sentiment and text_column:
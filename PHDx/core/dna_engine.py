@@ -3,16 +3,32 @@ DNA Engine - Linguistic Fingerprint Analyzer for PHDx
 
 This module analyzes .docx files to extract the author's unique writing style,
 creating a linguistic profile for maintaining consistency across thesis drafts.
+
+Sentences are the segments between runs of ".", "!" and "?". Segmentation
+and word counting classify characters through lookup tables
+(WHITESPACE_TABLE, SENTENCE_END_TABLE) instead of a regex split, so no
+sentence or word strings are built; word counts follow str.split().
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import re
+import uuid
+import zipfile
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from lxml import etree
 
-import anthropic
-from docx import Document
-from dotenv import load_dotenv
+if TYPE_CHECKING:
+    # Imported where a client is created; the SDK is slow to import
+    import anthropic
 
 # Import ethics utilities for AI usage logging
 try:
@@ -26,13 +42,63 @@ except ImportError:
     from core.ethics_utils import log_ai_usage, scrub_text
     from core.secrets_utils import get_secret
 
-# Load environment variables
-load_dotenv()
+# Optional: Aho-Corasick automaton for single-pass phrase counting
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Optional: orjson for faster profile and scan cache writes
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # Constants
 DRAFTS_DIR = Path(__file__).parent.parent / "drafts"
 DATA_DIR = Path(__file__).parent.parent / "data"
 DNA_OUTPUT_PATH = DATA_DIR / "author_dna.json"
+DNA_CACHE_SUFFIX = ".cache.json"
+# Bumped when _scan_section's counting changes, invalidating cached scans
+SCAN_VERSION = 2
+CLAUDE_CACHE_DIR = DATA_DIR / "claude_cache"
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_TIMEOUT_SECONDS = 120.0
+CLAUDE_MAX_RETRIES = 2
+
+# Separator between documents in the combined corpus
+DOCUMENT_SEPARATOR = "\n\n---\n\n"
+
+# Code points str.split() treats as whitespace; the final entry stands in
+# for every code point above the table
+WHITESPACE_TABLE = np.zeros(0x3002, dtype=bool)
+WHITESPACE_TABLE[[c for c in range(0x3001) if chr(c).isspace()]] = True
+
+# Code points that end a sentence segment ([.!?]+ runs)
+SENTENCE_END_TABLE = np.zeros(len(WHITESPACE_TABLE), dtype=bool)
+SENTENCE_END_TABLE[[ord(c) for c in ".!?"]] = True
+
+# Decimal places kept for the metrics written to the DNA profile
+PROFILE_FLOAT_DIGITS = 2
+
+# Token budget for the writing samples sent to Claude, at ~4 bytes per token
+MAX_ANALYSIS_TOKENS = 12_000
+BYTES_PER_TOKEN = 4
+
+# WordprocessingML namespace and the run elements that map to plain text
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RUN_TEXT_ELEMENTS = {
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+    W_NS + "ptab": "\t",
+    W_NS + "tab": "\t",
+}
 
 # Hedging phrases commonly used in academic writing
 HEDGING_PHRASES = [
@@ -132,12 +198,218 @@ TRANSITION_CATEGORIES = {
 }
 
 
-def load_docx_files(drafts_dir: Path = DRAFTS_DIR) -> list[dict]:
+def _build_phrase_automaton(vocabularies: tuple):
+    """Build an Aho-Corasick automaton matching any phrase of the vocabularies."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for group, phrases in enumerate(vocabularies):
+        for phrase in phrases:
+            automaton.add_word(phrase, (group, phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_phrase_pattern(phrases: list) -> re.Pattern:
+    """Compile a whole-word alternation of the phrases, longest first."""
+    alternatives = "|".join(
+        re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternatives})\b")
+
+
+# Flat phrase -> category lookup, in category order
+TRANSITION_PHRASE_CATEGORIES = {
+    phrase: category
+    for category, phrases in TRANSITION_CATEGORIES.items()
+    for phrase in phrases
+}
+TRANSITION_PHRASES = list(TRANSITION_PHRASE_CATEGORIES)
+
+# Vocabularies whose phrases are counted; overlapping matches are resolved
+# within a vocabulary, never across them
+PHRASE_VOCABULARIES = (HEDGING_PHRASES, TRANSITION_PHRASES)
+
+# One automaton covers every vocabulary so a corpus is scanned once; the
+# per-vocabulary patterns are the fallback without pyahocorasick
+PHRASE_AUTOMATON = _build_phrase_automaton(PHRASE_VOCABULARIES)
+PHRASE_PATTERNS = [_build_phrase_pattern(phrases) for phrases in PHRASE_VOCABULARIES]
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is a word character, as re word boundaries see it."""
+    return char.isalnum() or char == "_"
+
+
+def _count_phrases(text_lower: str) -> Counter:
+    """
+    Count whole-word occurrences of every vocabulary phrase in lowercased text.
+
+    Within a vocabulary, matches do not overlap: reading left to right, the
+    longest phrase at the earliest position wins. So "may" in "mayor" is not
+    counted, and "it suggests that" counts "it suggests" but not "suggests
+    that". These are the counts of PHRASE_PATTERNS' findall. The automaton
+    reproduces them from a single scan by filtering its raw matches.
+    """
+    if PHRASE_AUTOMATON is None:
+        return Counter(
+            match
+            for pattern in PHRASE_PATTERNS
+            for match in pattern.findall(text_lower)
+        )
+
+    # Raw matches with a word boundary at both ends, as (group, start, -end)
+    last = len(text_lower) - 1
+    candidates = []
+    for end, (group, phrase) in PHRASE_AUTOMATON.iter(text_lower):
+        start = end - len(phrase) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(text_lower[end + 1]):
+            continue
+        candidates.append((group, start, -end, phrase))
+
+    counts = Counter()
+    covered_until = [-1] * len(PHRASE_VOCABULARIES)
+    for group, start, neg_end, phrase in sorted(candidates):
+        if start > covered_until[group]:
+            counts[phrase] += 1
+            covered_until[group] = -neg_end
+    return counts
+
+
+def _paragraph_text(paragraph) -> str:
+    """Get a w:p element's text the way python-docx's Paragraph.text does."""
+    parts = []
+    for child in paragraph:
+        if child.tag == W_NS + "r":
+            runs = (child,)
+        elif child.tag == W_NS + "hyperlink":
+            runs = child.iterchildren(W_NS + "r")
+        else:
+            continue
+
+        for run in runs:
+            for element in run:
+                if element.tag == W_NS + "t":
+                    parts.append(element.text or "")
+                elif element.tag == W_NS + "br":
+                    if element.get(W_NS + "type", "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                else:
+                    parts.append(RUN_TEXT_ELEMENTS.get(element.tag, ""))
+    return "".join(parts)
+
+
+def _read_docx_paragraphs(docx_file: Path) -> list[str]:
+    """
+    Read the non-empty body paragraphs of a .docx file.
+
+    Streams word/document.xml with lxml iterparse and discards each body
+    element once read, rather than building python-docx's object tree.
+    Falls back to python-docx for packages whose main part is stored
+    elsewhere or does not parse as a stream.
+    """
+    try:
+        return _stream_docx_paragraphs(docx_file)
+    except (KeyError, etree.XMLSyntaxError):
+        from docx import Document
+
+        document = Document(docx_file)
+        return [p.text.strip() for p in document.paragraphs if p.text.strip()]
+
+
+def _stream_docx_paragraphs(docx_file: Path) -> list[str]:
+    """Read body paragraphs by streaming word/document.xml with iterparse."""
+    paragraphs = []
+    with (
+        zipfile.ZipFile(docx_file) as archive,
+        archive.open("word/document.xml") as document_xml,
+    ):
+        for _, element in etree.iterparse(document_xml, tag=W_NS + "p"):
+            parent = element.getparent()
+            if parent is None or parent.tag != W_NS + "body":
+                # Table cell or text box paragraph
+                continue
+
+            text = _paragraph_text(element).strip()
+            if text:
+                paragraphs.append(text)
+
+            # Free this paragraph and everything before it in the body
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+    return paragraphs
+
+
+def _char_codes(text: str) -> np.ndarray:
+    """Code points of the text, clamped to the character table range."""
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    return np.minimum(codes, len(WHITESPACE_TABLE) - 1)
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, as len(text.split()) would.
+
+    Classifies every character as space or not with one table lookup over
+    the encoded text and counts word starts, without building a list of
+    word strings.
+    """
+    if not text:
+        return 0
+
+    is_space = WHITESPACE_TABLE[_char_codes(text)]
+    # A word starts at a non-space that follows a space, or at the start
+    return int(np.count_nonzero(is_space[:-1] & ~is_space[1:])) + int(not is_space[0])
+
+
+def _round_metrics(value, ndigits: int = PROFILE_FLOAT_DIGITS):
+    """Round every float in a (nested) report for presentation."""
+    if isinstance(value, dict):
+        return {k: _round_metrics(v, ndigits) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_round_metrics(v, ndigits) for v in value]
+    if isinstance(value, float):
+        return round(value, ndigits)
+    return value
+
+
+def _document_section(filename: str, content: str) -> str:
+    """Format a document as its section of the combined corpus."""
+    return f"[{filename}]\n{content}"
+
+
+def _load_docx_file(docx_file: Path) -> dict:
+    """Load one draft and scan its corpus section (runs in a worker process)."""
+    content = "\n".join(_read_docx_paragraphs(docx_file))
+    return {
+        "filename": docx_file.name,
+        "content": content,
+        "scan": _scan_section(_document_section(docx_file.name, content)),
+    }
+
+
+def load_docx_files(
+    drafts_dir: Path = DRAFTS_DIR, cache: Optional[dict] = None
+) -> list[dict]:
     """
     Load all .docx files from the drafts directory.
 
+    Files are read and pre-scanned in parallel worker processes.
+
+    Args:
+        drafts_dir: Folder holding the .docx drafts
+        cache: Optional scan cache from _load_scan_cache. Files whose mtime
+            and size match their entry are reused without being reopened;
+            the cache is updated in place to the files loaded this run.
+
     Returns:
-        List of dicts with 'filename' and 'content' keys.
+        List of dicts with 'filename', 'content' and 'scan' keys.
         Returns empty list with friendly message if folder is empty.
     """
     documents = []
@@ -162,24 +434,108 @@ def load_docx_files(drafts_dir: Path = DRAFTS_DIR) -> list[dict]:
         print("=" * 60 + "\n")
         return documents
 
+    previous = dict(cache) if cache is not None else {}
+    stats = {path: _file_signature(path) for path in docx_files}
+    changed = [
+        path
+        for path in docx_files
+        if previous.get(path.name, {}).get("signature") != stats[path]
+    ]
+
+    futures = {}
+    if len(changed) == 1:
+        # A single draft is loaded in-process rather than paying for a pool
+        futures = {changed[0]: _run_in_process(_load_docx_file, changed[0])}
+    elif changed:
+        max_workers = min(len(changed), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {path: executor.submit(_load_docx_file, path) for path in changed}
+
+    if cache is not None:
+        cache.clear()
+
     for docx_file in docx_files:
-        try:
-            doc = Document(docx_file)
-            full_text = []
+        if docx_file in futures:
+            try:
+                document = futures[docx_file].result()
+                print(f"Loaded: {docx_file.name}")
+
+            except Exception as e:
+                print(f"Error loading {docx_file.name}: {e}")
+                continue
+        else:
+            document = previous[docx_file.name]["document"]
+            print(f"Unchanged: {docx_file.name}")
 
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    full_text.append(paragraph.text.strip())
+        documents.append(document)
+        if cache is not None:
+            cache[docx_file.name] = {
+                "signature": stats[docx_file],
+                "document": document,
+            }
 
-            documents.append(
-                {"filename": docx_file.name, "content": "\n".join(full_text)}
-            )
-            print(f"Loaded: {docx_file.name}")
+    return documents
 
-        except Exception as e:
-            print(f"Error loading {docx_file.name}: {e}")
 
-    return documents
+def _run_in_process(fn, *args) -> Future:
+    """Run fn now and wrap its result or exception in a completed Future."""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _file_signature(path: Path) -> list[int]:
+    """Scan format, modification time and size identifying a scanned draft."""
+    stat = path.stat()
+    return [SCAN_VERSION, stat.st_mtime_ns, stat.st_size]
+
+
+def _load_scan_cache(cache_path: Path) -> dict:
+    """Load the per-draft scan cache, or an empty cache if unreadable."""
+    if not cache_path.exists():
+        return {}
+    try:
+        raw = cache_path.read_bytes()
+        entries = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        for entry in entries.values():
+            scan = entry["document"]["scan"]
+            scan["phrase_counts"] = Counter(scan["phrase_counts"])
+            scan["segment_words"] = np.array(scan["segment_words"], dtype=np.int64)
+    except (KeyError, TypeError, ValueError, AttributeError, OSError):
+        # Corrupt or hand-edited caches are rebuilt rather than crashing the scan
+        return {}
+    return entries
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """
+    Write data as indented UTF-8 JSON, through orjson when available.
+
+    The JSON goes to a temporary file that then replaces the target, so an
+    interrupted write never leaves a truncated profile or cache behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name per call, so concurrent threads never share a temp file
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if ORJSON_AVAILABLE:
+            tmp_path.write_bytes(
+                orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            )
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                # numpy arrays and scalars both convert through tolist()
+                json.dump(
+                    data, f, indent=2, ensure_ascii=False, default=lambda o: o.tolist()
+                )
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def calculate_sentence_complexity(text: str) -> dict:
@@ -190,26 +546,56 @@ def calculate_sentence_complexity(text: str) -> dict:
         Dict with average_length, std_deviation, and length_distribution.
     """
     # Split into sentences (basic approach)
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s.strip() for s in sentences if s.strip() and len(s.split()) > 2]
+    return _summarize_sentence_lengths(_segment_word_counts(text))
 
-    if not sentences:
-        return {"average_length": 0, "total_sentences": 0, "length_distribution": {}}
 
-    lengths = [len(s.split()) for s in sentences]
-    avg_length = sum(lengths) / len(lengths)
+def _segment_word_counts(text: str) -> np.ndarray:
+    """
+    Word count of every [.!?]-delimited segment of the text.
+
+    Matches [len(s.split()) for s in re.split(r"[.!?]+", text)] without
+    materializing the segment or word strings: each character is classified
+    once, words are counted at their starts and assigned to segments by the
+    running count of sentence-ending runs.
+    """
+    if not text:
+        return np.zeros(1, dtype=np.int64)
+
+    codes = _char_codes(text)
+    is_end = SENTENCE_END_TABLE[codes]
+    # Sentence enders split words just like whitespace does
+    is_break = WHITESPACE_TABLE[codes] | is_end
+
+    word_start = ~is_break
+    word_start[1:] &= is_break[:-1]
+    end_run_start = is_end.copy()
+    end_run_start[1:] &= ~is_end[:-1]
+
+    segment_ids = np.cumsum(end_run_start)
+    n_segments = int(segment_ids[-1]) + 1
+    return np.bincount(segment_ids[word_start], minlength=n_segments)
 
-    # Categorize sentence lengths
+
+def _summarize_sentence_lengths(segment_words: np.ndarray) -> dict:
+    """Build the sentence complexity report from segment word counts."""
+    # Sentences are the segments over two words
+    lengths = segment_words[segment_words > 2]
+
+    if len(lengths) == 0:
+        return {"average_length": 0, "total_sentences": 0, "length_distribution": {}}
+
+    # Categorize sentence lengths into <=10, 11-20, 21-30 and 31+ words
+    buckets = np.bincount(np.searchsorted([10, 20, 30], lengths), minlength=4)
     distribution = {
-        "short (1-10 words)": len([wc for wc in lengths if wc <= 10]),
-        "medium (11-20 words)": len([wc for wc in lengths if 11 <= wc <= 20]),
-        "long (21-30 words)": len([wc for wc in lengths if 21 <= wc <= 30]),
-        "very_long (31+ words)": len([wc for wc in lengths if wc > 30]),
+        "short (1-10 words)": int(buckets[0]),
+        "medium (11-20 words)": int(buckets[1]),
+        "long (21-30 words)": int(buckets[2]),
+        "very_long (31+ words)": int(buckets[3]),
     }
 
     return {
-        "average_length": round(avg_length, 2),
-        "total_sentences": len(sentences),
+        "average_length": float(lengths.mean()),
+        "total_sentences": len(lengths),
         "length_distribution": distribution,
     }
 
@@ -221,14 +607,17 @@ def analyze_hedging_frequency(text: str) -> dict:
     Returns:
         Dict with hedging phrases found and their frequencies.
     """
-    text_lower = text.lower()
-    word_count = len(text.split())
+    counts = _count_phrases(text.lower())
+    return _summarize_hedging(counts, _count_words(text))
+
 
+def _summarize_hedging(counts: Counter, word_count: int) -> dict:
+    """Build the hedging report from phrase counts."""
     hedging_found = {}
     total_hedges = 0
 
     for phrase in HEDGING_PHRASES:
-        count = text_lower.count(phrase)
+        count = counts[phrase]
         if count > 0:
             hedging_found[phrase] = count
             total_hedges += count
@@ -239,7 +628,7 @@ def analyze_hedging_frequency(text: str) -> dict:
     return {
         "phrases_found": hedging_found,
         "total_hedges": total_hedges,
-        "hedging_density_per_1000_words": round(hedging_density, 2),
+        "hedging_density_per_1000_words": hedging_density,
         "word_count": word_count,
     }
 
@@ -251,22 +640,22 @@ def extract_transition_vocabulary(text: str) -> dict:
     Returns:
         Dict with transition words by category and frequencies.
     """
-    text_lower = text.lower()
-    word_count = len(text.split())
+    counts = _count_phrases(text.lower())
+    return _summarize_transitions(counts, _count_words(text))
+
 
+def _summarize_transitions(counts: Counter, word_count: int) -> dict:
+    """Build the transition vocabulary report from phrase counts."""
     transitions_by_category = {}
+    category_totals = Counter()
     total_transitions = 0
 
-    for category, phrases in TRANSITION_CATEGORIES.items():
-        category_matches = {}
-        for phrase in phrases:
-            count = text_lower.count(phrase)
-            if count > 0:
-                category_matches[phrase] = count
-                total_transitions += count
-
-        if category_matches:
-            transitions_by_category[category] = category_matches
+    for phrase, category in TRANSITION_PHRASE_CATEGORIES.items():
+        count = counts[phrase]
+        if count > 0:
+            transitions_by_category.setdefault(category, {})[phrase] = count
+            category_totals[category] += count
+            total_transitions += count
 
     # Calculate transition density
     transition_density = (
@@ -276,17 +665,74 @@ def extract_transition_vocabulary(text: str) -> dict:
     return {
         "by_category": transitions_by_category,
         "total_transitions": total_transitions,
-        "transition_density_per_1000_words": round(transition_density, 2),
+        "transition_density_per_1000_words": transition_density,
         "preferred_categories": sorted(
-            transitions_by_category.keys(),
-            key=lambda c: sum(transitions_by_category[c].values()),
-            reverse=True,
-        )[:3]
-        if transitions_by_category
-        else [],
+            category_totals, key=category_totals.__getitem__, reverse=True
+        )[:3],
     }
 
 
+def _scan_corpus(text: str) -> tuple[dict, dict, dict]:
+    """
+    Compute sentence complexity, hedging and transition metrics together.
+
+    The corpus is lowercased, split into words and scanned for phrases once,
+    and the hedging and transition reports are both built from that scan.
+
+    Returns:
+        (sentence_analysis, hedging_analysis, transition_analysis)
+    """
+    return _merge_scans([_scan_section(text)])
+
+
+def _scan_section(text: str) -> dict:
+    """
+    Scan one section of the corpus into counts that merge across sections.
+
+    Keeps per-segment word counts rather than sentence lengths, because the
+    first and last segments continue into the neighbouring sections.
+    """
+    return {
+        "phrase_counts": _count_phrases(text.lower()),
+        "word_count": _count_words(text),
+        "segment_words": _segment_word_counts(text),
+    }
+
+
+def _merge_scans(scans: list[dict]) -> tuple[dict, dict, dict]:
+    """
+    Combine section scans into the metrics of the sections joined with
+    DOCUMENT_SEPARATOR.
+
+    Returns:
+        (sentence_analysis, hedging_analysis, transition_analysis)
+    """
+    separator_words = len(DOCUMENT_SEPARATOR.split())
+    counts = Counter()
+    word_count = separator_words * (len(scans) - 1)
+    segments = []
+    carry = None
+
+    for scan in scans:
+        counts.update(scan["phrase_counts"])
+        word_count += scan["word_count"]
+
+        segment_words = scan["segment_words"]
+        if carry is not None:
+            # The previous section's last segment runs on into this one
+            segment_words = segment_words.copy()
+            segment_words[0] += carry + separator_words
+        segments.append(segment_words[:-1])
+        carry = segment_words[-1]
+    segments.append(np.array([carry], dtype=np.int64))
+
+    return (
+        _summarize_sentence_lengths(np.concatenate(segments)),
+        _summarize_hedging(counts, word_count),
+        _summarize_transitions(counts, word_count),
+    )
+
+
 def chunk_text_for_analysis(text: str, chunk_size: int = 2000) -> list[str]:
     """
     Split text into chunks of approximately chunk_size words.
@@ -311,42 +757,217 @@ def chunk_text_for_analysis(text: str, chunk_size: int = 2000) -> list[str]:
     return chunks
 
 
-def analyze_with_claude(combined_text: str, client: anthropic.Anthropic) -> dict:
+def sample_text_windows(
+    words: list[str], chunk_size: int, chunk_indices: Iterable[int]
+) -> list[str]:
+    """
+    Join only the selected chunks of a word list.
+
+    Gives chunk_text_for_analysis(...)[i] for each index without building
+    the chunks that are not sampled.
+
+    Args:
+        words: The text split into words
+        chunk_size: Words per chunk
+        chunk_indices: Indices of the chunks to build
+
+    Returns:
+        List of text chunks, in the order of chunk_indices
+    """
+    return [
+        " ".join(words[i * chunk_size : (i + 1) * chunk_size]) for i in chunk_indices
+    ]
+
+
+def truncate_to_token_budget(text: str, max_tokens: int = MAX_ANALYSIS_TOKENS) -> str:
+    """
+    Truncate text to roughly max_tokens, ending on a paragraph boundary.
+
+    The budget is applied to the UTF-8 encoding, and only a prefix of the
+    text is ever encoded, so a long corpus is not copied in full.
+    """
+    max_bytes = max_tokens * BYTES_PER_TOKEN
+    if len(text) * 4 <= max_bytes:
+        # Fits even if every character took the maximum four bytes
+        return text
+
+    # Any character beyond max_bytes would push the encoding over budget
+    encoded = text[: max_bytes + 1].encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+
+    budget = encoded[:max_bytes]
+    cut = budget.rfind(b"\n\n")
+    if cut <= 0:
+        cut = budget.rfind(b"\n")
+    if cut > 0:
+        budget = budget[:cut]
+    return budget.decode("utf-8", errors="ignore")
+
+
+def analyze_with_claude(
+    combined_text: str,
+    client: "anthropic.Anthropic",
+    word_count: Optional[int] = None,
+) -> dict:
     """
     Use Claude 3.5 Sonnet to perform deep linguistic analysis.
 
     Token Safety: Chunks text into 2,000-word blocks to prevent
     'Context Window Exceeded' errors with long PhD chapters.
 
+    Args:
+        combined_text: The corpus to analyze
+        client: Anthropic client
+        word_count: The corpus word count, if already known
+
     Returns:
         Dict with Claude's analysis of the writing style.
     """
+    samples = _sample_corpus(combined_text, word_count)
+    cached = _load_claude_cache(samples)
+    if cached is not None:
+        return cached
+
+    content = _build_claude_prompt(samples)
+
+    try:
+        response = client.messages.create(**_claude_request(content))
+        return _save_claude_cache(samples, _parse_claude_response(response))
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def analyze_with_claude_async(
+    texts: list[str], client: "anthropic.AsyncAnthropic"
+) -> list[dict]:
+    """
+    Analyze several corpora (e.g. chapter folders) with overlapping requests.
+
+    Each text gets the same sampling, caching, scrubbing and logging as
+    analyze_with_claude; the uncached requests are then awaited together.
+
+    Returns:
+        List of analysis dicts, in the order of texts.
+    """
+    samples = [_sample_corpus(text) for text in texts]
+    results = [_load_claude_cache(text_samples) for text_samples in samples]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    contents = [_build_claude_prompt(samples[i]) for i in pending]
+    responses = await asyncio.gather(
+        *(client.messages.create(**_claude_request(content)) for content in contents),
+        return_exceptions=True,
+    )
+    for i, response in zip(pending, responses):
+        if isinstance(response, Exception):
+            results[i] = {"error": str(response)}
+        else:
+            results[i] = _save_claude_cache(
+                samples[i], _parse_claude_response(response)
+            )
+    return results
+
+
+def analyze_corpora_with_claude(texts: list[str], api_key: str) -> list[dict]:
+    """
+    Analyze one or more corpora, running concurrently when there are several.
+
+    Returns:
+        List of analysis dicts, in the order of texts.
+    """
+    if len(texts) <= 1:
+        client = get_claude_client(api_key)
+        return [analyze_with_claude(text, client) for text in texts]
+
+    import anthropic
+
+    async def run() -> list[dict]:
+        async with anthropic.AsyncAnthropic(api_key=api_key) as client:
+            return await analyze_with_claude_async(texts, client)
+
+    return asyncio.run(run())
+
+
+# Global Claude client, reused so its connection pool survives across runs
+_claude_client = None
+_claude_client_key = None
+
+
+def get_claude_client(api_key: str) -> "anthropic.Anthropic":
+    """Get or create the shared Claude client for this API key."""
+    global _claude_client, _claude_client_key
+    if _claude_client is None or _claude_client_key != api_key:
+        import anthropic
+
+        _claude_client = anthropic.Anthropic(
+            api_key=api_key,
+            max_retries=CLAUDE_MAX_RETRIES,
+            timeout=CLAUDE_TIMEOUT_SECONDS,
+        )
+        _claude_client_key = api_key
+    return _claude_client
+
+
+def _sample_corpus(combined_text: str, word_count: Optional[int] = None) -> list[str]:
+    """
+    Sample and truncate a corpus to the writing samples sent to Claude.
+
+    Returns:
+        The samples, each sent as its own message content block
+    """
     # Token Safety: Chunk text into 2,000-word blocks
-    word_count = len(combined_text.split())
+    if word_count is None:
+        word_count = _count_words(combined_text)
     MAX_WORDS_FOR_SINGLE_ANALYSIS = 8000  # ~10k tokens
 
     if word_count > MAX_WORDS_FOR_SINGLE_ANALYSIS:
         print(
             f"  Text too long ({word_count:,} words). Chunking into 2,000-word blocks..."
         )
-        chunks = chunk_text_for_analysis(combined_text, chunk_size=2000)
-        print(f"  Created {len(chunks)} chunks for analysis")
+        words = combined_text.split()
+        n_chunks = -(-len(words) // 2000)
+        print(f"  Created {n_chunks} chunks for analysis")
 
         # Sample representative chunks (first, middle, last)
-        if len(chunks) > 4:
-            sample_indices = [0, len(chunks) // 3, 2 * len(chunks) // 3, -1]
-            sampled_chunks = [chunks[i] for i in sample_indices if i < len(chunks)]
-            combined_text = "\n\n[...section break...]\n\n".join(sampled_chunks)
-            print(f"  Sampled {len(sampled_chunks)} representative chunks")
+        if n_chunks > 4:
+            sample_indices = [0, n_chunks // 3, 2 * n_chunks // 3, n_chunks - 1]
+            samples = sample_text_windows(words, 2000, sample_indices)
+            print(f"  Sampled {len(samples)} representative chunks")
         else:
-            combined_text = "\n\n[...section break...]\n\n".join(chunks[:4])
+            samples = sample_text_windows(words, 2000, range(n_chunks))
+    else:
+        samples = [combined_text]
+
+    # Token Safety: Cap the samples at the token budget, on a paragraph break
+    budgeted = []
+    remaining_tokens = MAX_ANALYSIS_TOKENS
+    for sample in samples:
+        sample = truncate_to_token_budget(sample, remaining_tokens)
+        remaining_tokens -= -(-len(sample.encode("utf-8")) // BYTES_PER_TOKEN)
+        if sample:
+            budgeted.append(sample)
+        if remaining_tokens <= 0:
+            break
+    return budgeted
+
+
+def _build_claude_prompt(samples: list[str]) -> list[dict]:
+    """
+    Scrub the writing samples into the analysis message and log the usage.
+
+    Each sample is scrubbed and sent as its own text block, between the
+    instructions and the response format reminder.
 
+    Returns:
+        Message content blocks
+    """
     # Ethics scrubbing: Anonymize text before sending to AI
-    scrub_result = scrub_text(combined_text)
-    scrubbed_text = scrub_result["scrubbed_text"]
-    was_scrubbed = scrub_result["total_redactions"] > 0
+    scrub_results = [scrub_text(sample) for sample in samples]
+    total_redactions = sum(result["total_redactions"] for result in scrub_results)
 
-    prompt = f"""Analyze the following academic writing samples to create a detailed linguistic fingerprint of the author. Focus on:
+    instructions = """Analyze the following academic writing samples to create a detailed linguistic fingerprint of the author. Focus on:
 
 1. **Writing Voice & Tone**: Is it formal, semi-formal? First person or third person dominant? Passive vs active voice preference?
 
@@ -362,38 +983,81 @@ def analyze_with_claude(combined_text: str, client: anthropic.Anthropic) -> dict
 
 Provide your analysis as a structured JSON object with these categories. Be specific and provide examples where possible.
 
-TEXT SAMPLES:
-{scrubbed_text}
-
-Respond with ONLY a valid JSON object, no additional text."""
+TEXT SAMPLES (one per following block):"""
 
     # Log AI usage
     log_ai_usage(
         action_type="dna_analysis",
         data_source="drafts_folder",
-        prompt=f"Deep linguistic analysis of {len(combined_text)} chars",
-        was_scrubbed=was_scrubbed,
-        redactions_count=scrub_result["total_redactions"],
+        prompt=f"Deep linguistic analysis of {sum(map(len, samples))} chars",
+        was_scrubbed=total_redactions > 0,
+        redactions_count=total_redactions,
     )
 
+    return [
+        {"type": "text", "text": instructions},
+        *(
+            {"type": "text", "text": result["scrubbed_text"]}
+            for result in scrub_results
+        ),
+        {
+            "type": "text",
+            "text": "Respond with ONLY a valid JSON object, no additional text.",
+        },
+    ]
+
+
+def _claude_request(content: list[dict]) -> dict:
+    """Message request parameters for linguistic analysis content blocks."""
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 4096,
+        "messages": [{"role": "user", "content": content}],
+    }
+
+
+def _claude_cache_path(samples: list[str]) -> Path:
+    """Cache file for the analysis of a set of writing samples."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(CLAUDE_MODEL.encode())
+    for sample in samples:
+        # Length-prefixed, so different splits of the same text differ
+        digest.update(f"\n{len(sample)}\n".encode())
+        digest.update(sample.encode("utf-8", "surrogatepass"))
+    return CLAUDE_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _load_claude_cache(samples: list[str]) -> Optional[dict]:
+    """Load a cached analysis of these samples, if there is one."""
+    cache_path = _claude_cache_path(samples)
+    if not cache_path.exists():
+        return None
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        raw = cache_path.read_bytes()
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (ValueError, OSError):
+        return None
 
-        response_text = response.content[0].text
 
-        # Try to parse as JSON
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            # If not valid JSON, return as raw analysis
-            return {"raw_analysis": response_text}
+def _save_claude_cache(samples: list[str], analysis: dict) -> dict:
+    """Cache an analysis of these samples and return it."""
+    try:
+        _write_json(_claude_cache_path(samples), analysis)
+    except (OSError, TypeError):
+        pass
+    return analysis
 
-    except Exception as e:
-        return {"error": str(e)}
+
+def _parse_claude_response(response) -> dict:
+    """Parse Claude's reply as JSON, or keep it as raw analysis."""
+    response_text = response.content[0].text
+
+    # Try to parse as JSON
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        # If not valid JSON, return as raw analysis
+        return {"raw_analysis": response_text}
 
 
 def generate_author_dna(
@@ -402,6 +1066,9 @@ def generate_author_dna(
     """
     Main function to generate the complete author DNA profile.
 
+    Per-draft scans are cached next to the profile (author_dna.cache.json),
+    so a re-run only reads the drafts that changed since the last one.
+
     Returns:
         Complete DNA profile dict, or None if no documents found.
     """
@@ -411,37 +1078,34 @@ def generate_author_dna(
 
     # Load documents
     print("\n[1/5] Loading documents from drafts folder...")
-    documents = load_docx_files(drafts_dir)
+    cache_path = output_path.with_suffix(DNA_CACHE_SUFFIX)
+    scan_cache = _load_scan_cache(cache_path)
+    documents = load_docx_files(drafts_dir, cache=scan_cache)
 
     if not documents:
         print("No .docx files found in drafts folder. Please add thesis drafts.")
         return None
 
     print(f"Loaded {len(documents)} document(s)")
+    _write_json(cache_path, scan_cache)
 
-    # Combine all text for analysis
-    combined_text = "\n\n---\n\n".join(
-        [f"[{doc['filename']}]\n{doc['content']}" for doc in documents]
+    # Merge the per-document scans made while loading
+    sentence_analysis, hedging_analysis, transition_analysis = _merge_scans(
+        [doc["scan"] for doc in documents]
     )
 
-    total_words = len(combined_text.split())
+    total_words = hedging_analysis["word_count"]
     print(f"Total word count: {total_words:,}")
 
-    # Analyze sentence complexity
     print("\n[2/5] Analyzing sentence complexity...")
-    sentence_analysis = calculate_sentence_complexity(combined_text)
-    print(f"Average sentence length: {sentence_analysis['average_length']} words")
+    print(f"Average sentence length: {sentence_analysis['average_length']:.2f} words")
 
-    # Analyze hedging frequency
     print("\n[3/5] Analyzing hedging frequency...")
-    hedging_analysis = analyze_hedging_frequency(combined_text)
     print(
-        f"Hedging density: {hedging_analysis['hedging_density_per_1000_words']} per 1000 words"
+        f"Hedging density: {hedging_analysis['hedging_density_per_1000_words']:.2f} per 1000 words"
     )
 
-    # Extract transition vocabulary
     print("\n[4/5] Extracting transition vocabulary...")
-    transition_analysis = extract_transition_vocabulary(combined_text)
     print(
         f"Preferred transition categories: {', '.join(transition_analysis['preferred_categories'])}"
     )
@@ -451,30 +1115,32 @@ def generate_author_dna(
     api_key = get_secret("ANTHROPIC_API_KEY")
 
     if api_key:
-        client = anthropic.Anthropic(api_key=api_key)
-        claude_analysis = analyze_with_claude(combined_text, client)
+        # The combined corpus is only needed for Claude's writing samples
+        combined_text = DOCUMENT_SEPARATOR.join(
+            [_document_section(doc["filename"], doc["content"]) for doc in documents]
+        )
+        client = get_claude_client(api_key)
+        claude_analysis = analyze_with_claude(combined_text, client, total_words)
         print("Claude analysis complete")
     else:
         print("Warning: ANTHROPIC_API_KEY not set. Skipping Claude analysis.")
         claude_analysis = {"error": "API key not configured"}
 
-    # Compile DNA profile
+    # Compile DNA profile, rounding the metrics only now that they are final
     dna_profile = {
         "metadata": {
             "documents_analyzed": [doc["filename"] for doc in documents],
             "total_word_count": total_words,
             "analysis_version": "1.0",
         },
-        "sentence_complexity": sentence_analysis,
-        "hedging_analysis": hedging_analysis,
-        "transition_vocabulary": transition_analysis,
+        "sentence_complexity": _round_metrics(sentence_analysis),
+        "hedging_analysis": _round_metrics(hedging_analysis),
+        "transition_vocabulary": _round_metrics(transition_analysis),
         "claude_deep_analysis": claude_analysis,
     }
 
     # Save to file
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dna_profile, f, indent=2, ensure_ascii=False)
+    _write_json(output_path, dna_profile)
 
     print(f"\n{'=' * 60}")
     print(f"DNA profile saved to: {output_path}")
@@ -7,19 +7,59 @@ information (PII) from text before sending to LLMs, ensuring ethical AI usage.
 Uses both regex patterns and spaCy NER for comprehensive anonymization.
 """
 
+import atexit
+import bisect
 import csv
+import io
+import json
+import os
+import queue
 import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
+# Optional imports - graceful degradation if not available
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
 load_dotenv()
 
 # Paths
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "data"
 AI_USAGE_LOG = DATA_DIR / "ai_usage_log.csv"
+LEDGER_COLUMNS = [
+    "timestamp",
+    "action_type",
+    "data_source",
+    "prompt_preview",
+    "prompt_length",
+    "was_scrubbed",
+    "redactions_count",
+    "model_used",
+    "session_id",
+]
+# One ledger row in csv.writer's default dialect; text fields go through _csv_field
+LEDGER_ROW_FORMAT = ",".join("{}" for _ in LEDGER_COLUMNS) + "\r\n"
+# Starting guess at the size of a ledger row when reading the log's tail
+LEDGER_ROW_BYTES = 512
+
+# spaCy settings (only the NER component is used for anonymization)
+SPACY_MODEL = "en_core_web_sm"
+SPACY_UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+SPACY_BATCH_SIZE = 64
 
 
 # =============================================================================
@@ -71,6 +111,166 @@ PII_REPLACEMENTS = {
 }
 
 
+# Hyperscan cannot track match starts for the URL pattern's {1,256} repeat,
+# so it is located by its scheme, which every URL match begins with.
+PII_PREFILTER_OVERRIDES = {"url": re.compile(r"https?://")}
+
+# Non-ASCII characters that re treats as digits, whitespace or (ignoring case)
+# ASCII letters; the byte-level prefilter cannot see PII written with these.
+UNICODE_PII_CHARS = re.compile(
+    r"[^\D\x00-\x7f]|[^\S\x00-\x7f]|[\u0130\u0131\u017f\u212a]"
+)
+# ASCII separators re counts as \s but Hyperscan's \s does not
+PREFILTER_UNSEEN_WHITESPACE = "\x1c\x1d\x1e\x1f"
+
+
+def _build_pii_prefilter(patterns: dict[str, re.Pattern]):
+    """
+    Compile the PII patterns into one Hyperscan database for span location.
+
+    Each pattern's id is its index in PII_TYPES. Word boundaries are dropped
+    so that, on the ASCII-equivalent texts it is used for, the prefilter
+    matches wherever re could, including inside any substring of the text.
+    Returns None when Hyperscan is unavailable or rejects a pattern.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+
+    expressions, flags = [], []
+    for pii_type, pattern in patterns.items():
+        pattern = PII_PREFILTER_OVERRIDES.get(pii_type, pattern)
+        expressions.append(pattern.pattern.replace(r"\b", "").encode())
+        pattern_flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+        if pattern.flags & re.IGNORECASE:
+            pattern_flags |= hyperscan.HS_FLAG_CASELESS
+        flags.append(pattern_flags)
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=flags,
+        )
+    except hyperscan.error as error:
+        print(f"Hyperscan unavailable for PII scrubbing: {error}")
+        return None
+    return database
+
+
+PII_TYPES = list(PII_PATTERNS)
+PII_PREFILTER = _build_pii_prefilter(PII_PATTERNS)
+
+
+def _pii_candidate_spans(text: str) -> Optional[dict[str, list[tuple[int, int]]]]:
+    """
+    Locate spans that cover every possible PII match in one Hyperscan pass.
+
+    Returns (start, end) character offsets per PII type (types with no
+    candidates are absent), or None when the prefilter cannot be used for
+    this text.
+    """
+    if PII_PREFILTER is None:
+        return None
+    if any(char in text for char in PREFILTER_UNSEEN_WHITESPACE):
+        return None
+    if not text.isascii() and any(
+        UNICODE_PII_CHARS.match(char) for char in set(text) if not char.isascii()
+    ):
+        return None
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+
+    spans = []
+
+    def on_match(pattern_id, start, end, _flags, _context):
+        spans.append((pattern_id, start, end))
+
+    PII_PREFILTER.scan(data, match_event_handler=on_match)
+
+    if spans and len(data) != len(text):
+        # Translate UTF-8 byte offsets back to str indices
+        offsets = sorted({offset for span in spans for offset in span[1:]})
+        char_offsets, char_pos, prev = {}, 0, 0
+        for offset in offsets:
+            char_pos += len(data[prev:offset].decode("utf-8"))
+            char_offsets[offset] = char_pos
+            prev = offset
+        spans = [(i, char_offsets[start], char_offsets[end]) for i, start, end in spans]
+
+    by_type = {}
+    for pattern_id, start, end in spans:
+        by_type.setdefault(PII_TYPES[pattern_id], []).append((start, end))
+    return by_type
+
+
+class _SpanIndex:
+    """Candidate spans of one PII type, looked up by the range they end in."""
+
+    def __init__(self, spans: list[tuple[int, int]]):
+        self.spans = sorted(spans, key=lambda span: span[1])
+        self.ends = [end for _, end in self.spans]
+
+    def within(self, start: int, end: int) -> list[tuple[int, int]]:
+        """
+        Return the spans ending in (start, end], clipped to and relative to start.
+
+        Every match inside text[start:end] ends at one of these spans' ends
+        and starts no earlier than that span.
+        """
+        lo = bisect.bisect_right(self.ends, start)
+        hi = bisect.bisect_right(self.ends, end)
+        return sorted(
+            (max(span_start - start, 0), span_end - start)
+            for span_start, span_end in self.spans[lo:hi]
+        )
+
+
+def _search_spans(
+    pattern: re.Pattern, text: str, spans: list[tuple[int, int]]
+) -> Iterator[re.Match]:
+    """
+    Equivalent to pattern.finditer(text), searching only from candidate spans.
+
+    The regex only searches inside the Hyperscan candidate spans, so the
+    matches and their extent stay exactly those of the re engine while the
+    bulk of the text is never rescanned.
+    """
+    cursor = 0  # End of the last match; also where the next search may start
+    covered = 0  # Furthest candidate span end seen so far
+    i = 0
+    while True:
+        while i < len(spans) and spans[i][0] <= cursor:
+            covered = max(covered, spans[i][1])
+            i += 1
+        if cursor >= covered:
+            if i == len(spans):
+                return
+            start = spans[i][0]
+            covered = spans[i][1]
+            i += 1
+        else:
+            start = cursor
+
+        match = pattern.search(text, start)
+        if match is None:
+            return
+        yield match
+        cursor = match.end()
+
+
+def _interleave(segments: list[str], tokens: list[str]) -> str:
+    """Join text segments with the redaction tokens that separated them."""
+    parts = [segments[0]]
+    for token, segment in zip(tokens, segments[1:]):
+        parts.append(token)
+        parts.append(segment)
+    return "".join(parts)
+
+
 class EthicsScrubber:
     """
     Anonymizes text by removing personally identifiable information.
@@ -100,13 +300,13 @@ class EthicsScrubber:
 
             # Try to load the model, download if not available
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = spacy.load(SPACY_MODEL, disable=SPACY_UNUSED_COMPONENTS)
             except OSError:
                 print("Downloading spaCy model...")
                 from spacy.cli import download
 
-                download("en_core_web_sm")
-                self.nlp = spacy.load("en_core_web_sm")
+                download(SPACY_MODEL)
+                self.nlp = spacy.load(SPACY_MODEL, disable=SPACY_UNUSED_COMPONENTS)
         except ImportError:
             print("spaCy not available. Using regex-only anonymization.")
             self.use_spacy = False
@@ -121,17 +321,70 @@ class EthicsScrubber:
         Returns:
             Tuple of (scrubbed_text, scrub_report)
         """
-        scrubbed = text
-        report = {"method": "regex", "items_found": {}, "total_redactions": 0}
+        segments, tokens, report = self._regex_segments(text)
+        return _interleave(segments, tokens), report
 
-        for pii_type, pattern in PII_PATTERNS.items():
-            matches = pattern.findall(scrubbed)
-            if matches:
-                report["items_found"][pii_type] = len(matches)
-                report["total_redactions"] += len(matches)
-                scrubbed = pattern.sub(PII_REPLACEMENTS[pii_type], scrubbed)
+    def _regex_segments(self, text: str) -> tuple[list[str], list[str], dict]:
+        """
+        Redact regex PII one type at a time, keeping the text between matches apart.
+
+        Types are applied in PII_PATTERNS order, each only to the text earlier
+        types left unredacted, so overlapping PII of different types is all
+        redacted. No pattern can match a redaction token's brackets, so this
+        is the same as substituting each pattern over the whole text in turn.
+        The Hyperscan prefilter skips types, and stretches of text, that
+        cannot contain a match.
 
-        return scrubbed, report
+        Args:
+            text: Input text to scrub
+
+        Returns:
+            Tuple of (segments, tokens, scrub_report); the scrubbed text is the
+            segments interleaved with the redaction tokens
+        """
+        candidates = _pii_candidate_spans(text)
+        counts = Counter()
+        # Alternating (start, end) ranges of unredacted text and tokens
+        parts = [(0, len(text))]
+
+        for pii_type, pattern in PII_PATTERNS.items():
+            index = None
+            if candidates is not None:
+                if pii_type not in candidates:
+                    continue
+                index = _SpanIndex(candidates[pii_type])
+
+            token = PII_REPLACEMENTS[pii_type]
+            new_parts = []
+            for part in parts:
+                if isinstance(part, str):
+                    new_parts.append(part)
+                    continue
+                start, end = part
+                if index is None:
+                    matches = pattern.finditer(text[start:end])
+                else:
+                    spans = index.within(start, end)
+                    if not spans:
+                        new_parts.append(part)
+                        continue
+                    matches = _search_spans(pattern, text[start:end], spans)
+                cursor = 0
+                for match in matches:
+                    counts[pii_type] += 1
+                    new_parts.append((start + cursor, start + match.start()))
+                    new_parts.append(token)
+                    cursor = match.end()
+                new_parts.append((start + cursor, end))
+            parts = new_parts
+
+        segments = [text[start:end] for start, end in parts[::2]]
+        report = {
+            "method": "regex",
+            "items_found": {t: counts[t] for t in PII_PATTERNS if counts[t]},
+            "total_redactions": sum(counts.values()),
+        }
+        return segments, parts[1::2], report
 
     def scrub_names_spacy(self, text: str) -> tuple[str, dict]:
         """
@@ -146,8 +399,19 @@ class EthicsScrubber:
         if not self.nlp:
             return text, {"method": "spacy", "error": "spaCy not loaded"}
 
-        doc = self.nlp(text)
-        scrubbed = text
+        return self._redact_entities(self.nlp(text), text)
+
+    def _redact_entities(self, doc, text: str) -> tuple[str, dict]:
+        """
+        Replace the named entities spaCy found in text.
+
+        Args:
+            doc: spaCy Doc produced from text
+            text: The text the Doc was built from
+
+        Returns:
+            Tuple of (scrubbed_text, scrub_report)
+        """
         report = {"method": "spacy_ner", "entities_found": {}, "total_redactions": 0}
 
         # Entity types to redact
@@ -160,10 +424,11 @@ class EthicsScrubber:
             "NORP": "[GROUP_REDACTED]",  # Nationalities, religious, political groups
         }
 
-        # Sort entities by start position (reverse) to replace from end
-        entities = sorted(doc.ents, key=lambda e: e.start_char, reverse=True)
-
-        for ent in entities:
+        # Build the output left to right rather than re-slicing the whole
+        # text for every entity
+        parts = []
+        cursor = 0
+        for ent in sorted(doc.ents, key=lambda e: e.start_char):
             if ent.label_ in redact_types:
                 # Count entities
                 if ent.label_ not in report["entities_found"]:
@@ -172,12 +437,12 @@ class EthicsScrubber:
                 report["total_redactions"] += 1
 
                 # Replace in text
-                replacement = redact_types[ent.label_]
-                scrubbed = (
-                    scrubbed[: ent.start_char] + replacement + scrubbed[ent.end_char :]
-                )
+                parts.append(text[cursor : ent.start_char])
+                parts.append(redact_types[ent.label_])
+                cursor = ent.end_char
 
-        return scrubbed, report
+        parts.append(text[cursor:])
+        return "".join(parts), report
 
     def scrub(self, text: str, include_names: bool = True) -> dict:
         """
@@ -190,25 +455,118 @@ class EthicsScrubber:
         Returns:
             dict with scrubbed_text, original_length, scrubbed_length, reports
         """
+        return self.scrub_many([text], include_names)[0]
+
+    def scrub_many(
+        self,
+        texts: list[str],
+        include_names: bool = True,
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> list[dict]:
+        """
+        Full anonymization pipeline for a batch of texts.
+
+        Names are detected with nlp.pipe, which streams the texts through
+        spaCy in batches instead of running the pipeline once per text.
+
+        Args:
+            texts: Input texts to scrub
+            include_names: Whether to use spaCy for name detection
+            batch_size: Number of texts spaCy processes per batch
+            n_process: Number of spaCy worker processes
+
+        Returns:
+            List of scrub result dicts, in the same order as texts
+        """
+        # Step 1: Regex-based scrubbing
+        regex_results = [self._regex_segments(text) for text in texts]
+        scrubbed_texts = [
+            _interleave(segments, tokens) for segments, tokens, _ in regex_results
+        ]
+
+        # Step 2: spaCy NER-based scrubbing (optional)
+        spacy_results = [None] * len(texts)
+        if include_names and self.use_spacy:
+            if self.nlp:
+                spacy_results = self._redact_segments(
+                    regex_results, batch_size, n_process
+                )
+            else:
+                spacy_results = [self.scrub_names_spacy(t) for t in scrubbed_texts]
+
+        return [
+            self._scrub_result(text, (scrubbed, regex_report), spacy_result)
+            for text, scrubbed, (_, _, regex_report), spacy_result in zip(
+                texts, scrubbed_texts, regex_results, spacy_results
+            )
+        ]
+
+    def _redact_segments(
+        self,
+        regex_results: list[tuple[list[str], list[str], dict]],
+        batch_size: int,
+        n_process: int,
+    ) -> list[tuple[str, dict]]:
+        """
+        Run NER over the text between regex redactions and stitch it back.
+
+        Redaction tokens are never sent to spaCy, so it spends no time on
+        them and cannot mistake them for entities.
+
+        Args:
+            regex_results: Output of _regex_segments for each text
+            batch_size: Number of segments spaCy processes per batch
+            n_process: Number of spaCy worker processes
+
+        Returns:
+            List of (scrubbed_text, scrub_report) tuples, one per text
+        """
+        all_segments = [seg for segments, _, _ in regex_results for seg in segments]
+        docs = iter(
+            self.nlp.pipe(all_segments, batch_size=batch_size, n_process=n_process)
+        )
+
+        results = []
+        for segments, tokens, _ in regex_results:
+            report = {
+                "method": "spacy_ner",
+                "entities_found": {},
+                "total_redactions": 0,
+            }
+            redacted = []
+            for segment, doc in zip(segments, docs):
+                scrubbed, segment_report = self._redact_entities(doc, segment)
+                redacted.append(scrubbed)
+                for label, count in segment_report["entities_found"].items():
+                    found = report["entities_found"]
+                    found[label] = found.get(label, 0) + count
+                report["total_redactions"] += segment_report["total_redactions"]
+            results.append((_interleave(redacted, tokens), report))
+
+        return results
+
+    def _scrub_result(
+        self,
+        text: str,
+        regex_result: tuple[str, dict],
+        spacy_result: Optional[tuple[str, dict]],
+    ) -> dict:
+        """Assemble the scrub result dict from the regex and spaCy stages."""
+        scrubbed, regex_report = regex_result
         result = {
             "original_text": text,
             "original_length": len(text),
             "scrubbed_text": text,
             "scrubbed_length": 0,
             "is_clean": True,
-            "reports": [],
-            "total_redactions": 0,
+            "reports": [regex_report],
+            "total_redactions": regex_report["total_redactions"],
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Step 1: Regex-based scrubbing
-        scrubbed, regex_report = self.scrub_regex(text)
-        result["reports"].append(regex_report)
-        result["total_redactions"] += regex_report["total_redactions"]
-
-        # Step 2: spaCy NER-based scrubbing (optional)
-        if include_names and self.use_spacy:
-            scrubbed, spacy_report = self.scrub_names_spacy(scrubbed)
+        if spacy_result is not None:
+            scrubbed, spacy_report = spacy_result
             result["reports"].append(spacy_report)
             result["total_redactions"] += spacy_report["total_redactions"]
 
@@ -237,6 +595,14 @@ class EthicsScrubber:
 # =============================================================================
 
 
+def _csv_field(value) -> str:
+    """Format and quote a field exactly as csv.writer's default dialect would."""
+    text = value if isinstance(value, str) else "" if value is None else str(value)
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
 class AIUsageLedger:
     """
     Logs all AI interactions for audit trail and ethical compliance.
@@ -248,11 +614,22 @@ class AIUsageLedger:
         """
         Initialize the usage ledger.
 
+        Rows are appended by a background writer thread, started on the first
+        log() call, so logging never waits on file I/O. Usage statistics are
+        kept in a JSON sidecar next to the log and only rows appended since
+        the last call are scanned.
+
         Args:
             log_path: Path to the CSV log file
         """
         self.log_path = log_path
+        self.stats_path = log_path.with_suffix(".stats.json")
         self._ensure_log_exists()
+        self._stats = None
+        self._stats_lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
 
     def _ensure_log_exists(self):
         """Create log file with headers if it doesn't exist."""
@@ -261,19 +638,105 @@ class AIUsageLedger:
         if not self.log_path.exists():
             with open(self.log_path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "timestamp",
-                        "action_type",
-                        "data_source",
-                        "prompt_preview",
-                        "prompt_length",
-                        "was_scrubbed",
-                        "redactions_count",
-                        "model_used",
-                        "session_id",
-                    ]
-                )
+                writer.writerow(LEDGER_COLUMNS)
+
+        with open(self.log_path, "r", newline="", encoding="utf-8") as f:
+            self._header = next(csv.reader(f), LEDGER_COLUMNS)
+
+    def _start_writer(self) -> threading.Thread:
+        """Start the background writer thread if it isn't running."""
+        with self._writer_lock:
+            if self._writer_thread is None:
+                atexit.register(self.close)
+            elif self._writer_thread.is_alive():
+                return self._writer_thread
+            self._writer_thread = threading.Thread(
+                target=self._write_rows, name="ai-usage-ledger", daemon=True
+            )
+            self._writer_thread.start()
+            return self._writer_thread
+
+    def _write_rows(self):
+        """
+        Append queued rows, flushing whenever the queue runs dry.
+
+        A row that cannot be written is reported and skipped, so it never
+        takes the rows logged after it down with it.
+        """
+        with open(
+            self.log_path, "a", newline="", encoding="utf-8", errors="replace"
+        ) as f:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                try:
+                    if isinstance(item, threading.Event):
+                        f.flush()
+                    else:
+                        f.write(self._format_row(item))
+                        if self._queue.empty():
+                            f.flush()
+                except Exception as error:
+                    print(f"Could not write AI usage log row: {error}")
+                finally:
+                    if isinstance(item, threading.Event):
+                        item.set()
+
+    @staticmethod
+    def _format_row(item: tuple) -> str:
+        """Format a queued row as a CSV line, timestamping it from epoch seconds."""
+        (
+            logged_at,
+            action_type,
+            data_source,
+            prompt_preview,
+            prompt_length,
+            was_scrubbed,
+            redactions_count,
+            model_used,
+            session_id,
+        ) = item
+        return LEDGER_ROW_FORMAT.format(
+            datetime.fromtimestamp(logged_at).isoformat(),
+            _csv_field(action_type),
+            _csv_field(data_source),
+            _csv_field(prompt_preview),
+            prompt_length,
+            was_scrubbed,
+            redactions_count,
+            _csv_field(model_used),
+            _csv_field(session_id),
+        )
+
+    def flush(self):
+        """Block until every row logged so far has been written to disk."""
+        if self._writer_thread is None:
+            return
+        thread = self._start_writer()
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.1):
+            if not thread.is_alive():
+                return
+
+    def close(self):
+        """Write any pending rows and stop the writer thread."""
+        with self._writer_lock:
+            thread = self._writer_thread
+            if thread is None:
+                return
+            if thread.is_alive():
+                self._queue.put(None)
+                thread.join()
+            self._writer_thread = None
+            atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def log(
         self,
@@ -302,21 +765,22 @@ class AIUsageLedger:
         if len(prompt) > 200:
             prompt_preview += "..."
 
-        with open(self.log_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    datetime.now().isoformat(),
-                    action_type,
-                    data_source,
-                    prompt_preview,
-                    len(prompt),
-                    was_scrubbed,
-                    redactions_count,
-                    model_used,
-                    session_id or "default",
-                ]
+        thread = self._writer_thread
+        if thread is None or not thread.is_alive():
+            self._start_writer()
+        self._queue.put_nowait(
+            (
+                time.time(),
+                action_type,
+                data_source,
+                prompt_preview,
+                len(prompt),
+                was_scrubbed,
+                redactions_count,
+                model_used,
+                session_id or "default",
             )
+        )
 
     def get_recent_logs(self, limit: int = 10) -> list[dict]:
         """
@@ -328,16 +792,37 @@ class AIUsageLedger:
         Returns:
             List of log entry dictionaries
         """
+        self.flush()
         if not self.log_path.exists():
             return []
 
-        entries = []
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                entries.append(row)
+        header = self._header
+        return [dict(zip(header, row)) for row in self._tail_rows(limit)[-limit:]]
 
-        return entries[-limit:]
+    def _tail_rows(self, n_rows: int) -> list[list[str]]:
+        """
+        Parse at least the last n_rows rows of the log, reading from the end.
+
+        Only a window sized for n_rows is read, doubling until it holds enough
+        complete rows or reaches the header; n_rows <= 0 reads every row.
+        """
+        with open(self.log_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            window = n_rows * LEDGER_ROW_BYTES if n_rows > 0 else size
+            while True:
+                start = max(size - window, 0)
+                f.seek(start)
+                data = f.read(size - start)
+                newline = data.find(b"\n")
+                if newline < 0 and start > 0:
+                    window *= 2
+                    continue
+                # Drop the header, or the row the window starts partway into
+                data = data[newline + 1 :]
+                rows = list(csv.reader(io.StringIO(data.decode("utf-8"), newline="")))
+                if start == 0 or len(rows) >= n_rows:
+                    return rows
+                window *= 2
 
     def get_stats(self) -> dict:
         """
@@ -346,57 +831,157 @@ class AIUsageLedger:
         Returns:
             dict with usage statistics
         """
+        self.flush()
         if not self.log_path.exists():
             return {"total_calls": 0, "by_action": {}}
 
-        stats = {
-            "total_calls": 0,
-            "by_action": {},
-            "by_source": {},
-            "scrubbed_percentage": 0,
-            "total_redactions": 0,
-        }
-
-        scrubbed_count = 0
-
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                stats["total_calls"] += 1
-
-                action = row.get("action_type", "unknown")
-                stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-
-                source = row.get("data_source", "unknown")
-                stats["by_source"][source] = stats["by_source"].get(source, 0) + 1
-
-                if row.get("was_scrubbed") == "True":
-                    scrubbed_count += 1
-
-                stats["total_redactions"] += int(row.get("redactions_count", 0))
+        with self._stats_lock:
+            if self._stats is None:
+                self._stats = self._load_stats()
+            offset = self._stats["offset"]
+            if self.log_path.stat().st_size < offset:
+                # The log was truncated or replaced, so recount it
+                self._stats = self._empty_stats()
+            self._count_new_rows()
+            if self._stats["offset"] != offset:
+                self._save_stats()
+            counts = self._stats
+
+            stats = {
+                "total_calls": counts["total_calls"],
+                "by_action": dict(counts["by_action"]),
+                "by_source": dict(counts["by_source"]),
+                "scrubbed_percentage": 0,
+                "total_redactions": counts["total_redactions"],
+            }
 
         if stats["total_calls"] > 0:
             stats["scrubbed_percentage"] = round(
-                scrubbed_count / stats["total_calls"] * 100, 1
+                counts["scrubbed_count"] / stats["total_calls"] * 100, 1
             )
 
         return stats
 
+    @staticmethod
+    def _empty_stats() -> dict:
+        """Counts for a log with no rows scanned yet."""
+        return {
+            "offset": 0,
+            "total_calls": 0,
+            "by_action": Counter(),
+            "by_source": Counter(),
+            "scrubbed_count": 0,
+            "total_redactions": 0,
+        }
+
+    def _load_stats(self) -> dict:
+        """Load the stats sidecar, or empty counts if it is missing or unreadable."""
+        stats = self._empty_stats()
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return stats
+        if not isinstance(saved, dict) or saved.keys() != stats.keys():
+            return stats
+        saved["by_action"] = Counter(saved["by_action"])
+        saved["by_source"] = Counter(saved["by_source"])
+        return saved
+
+    def _save_stats(self):
+        """Atomically replace the stats sidecar with the current counts."""
+        tmp_path = self.stats_path.with_name(
+            f".{self.stats_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f)
+            os.replace(tmp_path, self.stats_path)
+        except OSError:
+            # The sidecar is only a cache; the log itself stays authoritative
+            pass
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _count_new_rows(self):
+        """
+        Add rows appended after the sidecar's byte offset to the counts.
+
+        New rows are counted into locals and merged only once the scan has
+        finished, so a failed scan leaves the counts and offset untouched.
+        """
+        stats = self._stats
+        offset = stats["offset"]
+
+        def complete_lines(f):
+            # A partly written last row is left for the next call
+            nonlocal offset
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                offset += len(line)
+                yield line.decode("utf-8", errors="replace")
+
+        by_action = Counter()
+        by_source = Counter()
+        calls = scrubbed = redactions = 0
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            lines = complete_lines(f)
+            if offset == 0 and next(lines, None) is None:
+                return
+
+            for row in csv.reader(lines):
+                # Skip blank, truncated or hand-edited rows rather than fail
+                if len(row) != len(LEDGER_COLUMNS):
+                    continue
+                _, action, source, _, _, was_scrubbed, redactions_count, _, _ = row
+                try:
+                    redactions_count = int(redactions_count)
+                except ValueError:
+                    continue
+                calls += 1
+                by_action[action] += 1
+                by_source[source] += 1
+                scrubbed += was_scrubbed == "True"
+                redactions += redactions_count
+
+        stats["offset"] = offset
+        stats["by_action"].update(by_action)
+        stats["by_source"].update(by_source)
+        stats["total_calls"] += calls
+        stats["scrubbed_count"] += scrubbed
+        stats["total_redactions"] += redactions
+
 
 # =============================================================================
 # SINGLETON INSTANCES
 # =============================================================================
 
-# Global scrubber instance
-_scrubber = None
+# Global scrubber instances (the spaCy one is only loaded when names are needed)
+_scrubber_regex = None
+_scrubber_spacy = None
+
+
+def get_scrubber(include_names: bool = True) -> EthicsScrubber:
+    """
+    Get or create a global ethics scrubber instance.
 
+    Args:
+        include_names: Whether the scrubber needs spaCy for name detection;
+            if not, a regex-only scrubber is returned without loading spaCy
 
-def get_scrubber() -> EthicsScrubber:
-    """Get or create the global ethics scrubber instance."""
-    global _scrubber
-    if _scrubber is None:
-        _scrubber = EthicsScrubber(use_spacy=True)
-    return _scrubber
+    Returns:
+        The shared EthicsScrubber for that mode
+    """
+    global _scrubber_regex, _scrubber_spacy
+    if include_names:
+        if _scrubber_spacy is None:
+            _scrubber_spacy = EthicsScrubber(use_spacy=True)
+        return _scrubber_spacy
+    if _scrubber_regex is None:
+        _scrubber_regex = EthicsScrubber(use_spacy=False)
+    return _scrubber_regex
 
 
 # Global ledger instance
@@ -427,7 +1012,21 @@ def scrub_text(text: str, include_names: bool = True) -> dict:
     Returns:
         Scrub result dict
     """
-    return get_scrubber().scrub(text, include_names)
+    return get_scrubber(include_names).scrub(text, include_names)
+
+
+def scrub_texts(texts: list[str], include_names: bool = True) -> list[dict]:
+    """
+    Convenience function to scrub a batch of texts.
+
+    Args:
+        texts: Texts to anonymize
+        include_names: Whether to use spaCy NER for names
+
+    Returns:
+        List of scrub result dicts
+    """
+    return get_scrubber(include_names).scrub_many(texts, include_names)
 
 
 def quick_scrub(text: str) -> str:
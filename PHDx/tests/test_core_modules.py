@@ -172,6 +172,103 @@ class TestAirlock:
                 or "client_secret" in status["message"].lower()
             )
 
+    def test_http_cache_is_opt_in_and_cleared(self, tmp_path):
+        """Only opted-in reads should use the disk cache, and sign-out purges it."""
+        import core.airlock as airlock_module
+
+        cache_dir = tmp_path / ".http_cache"
+        cache_dir.mkdir()
+        (cache_dir / "entry").write_text("cached body")
+        with (
+            patch.object(airlock_module, "HTTP_CACHE_DIR", cache_dir),
+            patch.object(airlock_module, "TOKEN_PATH", tmp_path / "token.json"),
+            patch.object(airlock_module.httplib2, "Http") as http,
+            patch.object(airlock_module, "AuthorizedHttp"),
+            patch.object(airlock_module, "build_from_document"),
+            patch.object(airlock_module, "_discovery_document", return_value={}),
+        ):
+            airlock_module._build_service("docs", "v1", Mock())
+            assert http.call_args.kwargs["cache"] is None
+            airlock_module._build_service("drive", "v3", Mock(), http_cache=True)
+            assert http.call_args.kwargs["cache"] == str(cache_dir)
+
+            airlock_module.clear_credentials()
+        assert not cache_dir.exists()
+
+    def test_should_refresh_tokens_close_to_expiry(self):
+        """Tokens inside the refresh margin should be refreshed before use."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.oauth2.credentials import Credentials
+
+        from core.airlock import TOKEN_REFRESH_MARGIN, _should_refresh
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        soon = now + TOKEN_REFRESH_MARGIN - timedelta(seconds=30)
+        later = now + TOKEN_REFRESH_MARGIN + timedelta(minutes=10)
+
+        assert _should_refresh(Credentials("t", refresh_token="r", expiry=soon))
+        assert not _should_refresh(Credentials("t", refresh_token="r", expiry=later))
+        assert not _should_refresh(Credentials("t", refresh_token=None, expiry=soon))
+        assert not _should_refresh(Credentials("t", refresh_token="r"))
+
+    def test_failed_early_refresh_keeps_valid_token(self, tmp_path):
+        """A refresh failing inside the margin should not sign the user out."""
+        from datetime import datetime, timedelta, timezone
+
+        from google.auth.exceptions import TransportError
+        from google.oauth2.credentials import Credentials
+
+        import core.airlock as airlock_module
+
+        expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=4, seconds=30
+        )
+        token_path = tmp_path / "token.json"
+        token_path.write_text(
+            Credentials(
+                "t",
+                refresh_token="r",
+                token_uri="https://oauth2.googleapis.com/token",
+                client_id="id",
+                client_secret="secret",
+                expiry=expiry,
+            ).to_json()
+        )
+        with (
+            patch.object(airlock_module, "TOKEN_PATH", token_path),
+            patch.object(airlock_module, "CONFIG_DIR", tmp_path),
+            patch.object(
+                Credentials, "refresh", side_effect=TransportError("offline")
+            ) as refresh,
+        ):
+            assert airlock_module.get_credentials().token == "t"
+            assert airlock_module.authenticate_user().token == "t"
+        assert refresh.call_count == 2
+
+    def test_orjson_model_matches_json_model(self):
+        """The orjson response model should decode like the library default."""
+        from googleapiclient.model import JsonModel
+
+        import core.airlock as airlock_module
+
+        if not airlock_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        for wrapped in (False, True):
+            for content in (b'{"a": 1}', '{"data": {"b": [1, 2]}}', b"not json"):
+                assert airlock_module.OrjsonModel(wrapped).deserialize(
+                    content
+                ) == JsonModel(wrapped).deserialize(content)
+
+    def test_discovery_document_is_parsed_once(self):
+        """Service builds should reuse one parsed discovery document."""
+        import core.airlock as airlock_module
+
+        first = airlock_module._discovery_document("docs", "v1")
+        assert first is airlock_module._discovery_document("docs", "v1")
+        assert "documents" in first["resources"]
+
 
 # =============================================================================
 # DNA ENGINE TESTS
@@ -223,6 +320,69 @@ class TestDNAEngine:
         assert result["total_transitions"] >= 3
         assert "by_category" in result
 
+    def test_phrase_counts_are_whole_word_and_non_overlapping(self):
+        """Test phrases count as whole words, longest first within a vocabulary."""
+        from collections import Counter
+
+        from core.dna_engine import PHRASE_PATTERNS, _count_phrases
+
+        text = (
+            "it suggests that the mayor may, perhaps, agree; one might argue "
+            "it appears to summarize enthusiasm thus far."
+        )
+        counts = _count_phrases(text)
+
+        assert counts == Counter(
+            {
+                "it suggests": 1,
+                "may": 1,
+                "perhaps": 1,
+                "one might argue": 1,
+                "appears to": 1,
+                "to summarize": 1,
+                "thus": 1,
+            }
+        )
+        assert counts == Counter(
+            match for pattern in PHRASE_PATTERNS for match in pattern.findall(text)
+        )
+
+    def test_read_docx_paragraphs_matches_python_docx(self, tmp_path):
+        """Test streamed .docx text matches python-docx body paragraphs."""
+        from docx import Document
+
+        from core.dna_engine import _read_docx_paragraphs
+
+        doc = Document()
+        doc.add_heading("Chapter One", 1)
+        doc.add_paragraph("First\tparagraph").add_run(" continues").add_break()
+        doc.add_paragraph("   ")
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "Table text"
+        doc.add_paragraph("After the table.")
+        path = tmp_path / "draft.docx"
+        doc.save(path)
+
+        expected = [p.text.strip() for p in Document(path).paragraphs if p.text.strip()]
+        assert _read_docx_paragraphs(path) == expected
+
+    def test_merged_section_scans_match_combined_corpus(self):
+        """Test per-document scans merge to the combined corpus metrics."""
+        from core.dna_engine import (
+            DOCUMENT_SEPARATOR,
+            _merge_scans,
+            _scan_corpus,
+            _scan_section,
+        )
+
+        sections = [
+            "[ch1.docx]\nHowever, this may suggest a trend. It continues",
+            "[ch2.docx]\ninto the next chapter without a full stop",
+            "[ch3.docx]\nTherefore, perhaps the data might indicate otherwise!",
+        ]
+
+        merged = _merge_scans([_scan_section(s) for s in sections])
+        assert merged == _scan_corpus(DOCUMENT_SEPARATOR.join(sections))
+
     def test_chunk_text_for_analysis(self):
         """Test text chunking."""
         from core.dna_engine import chunk_text_for_analysis
@@ -234,6 +394,81 @@ class TestDNAEngine:
         chunks = chunk_text_for_analysis(text, chunk_size=2000)
         assert len(chunks) == 3  # 5000/2000 = 2.5, rounds up to 3
 
+    def test_truncate_to_token_budget(self):
+        """Test truncation stops at a paragraph break within the budget."""
+        from core.dna_engine import truncate_to_token_budget
+
+        text = "\n\n".join(f"Paragraph {i}. " + "word " * 50 for i in range(100))
+        truncated = truncate_to_token_budget(text, max_tokens=500)
+
+        assert len(truncated.encode("utf-8")) <= 2000
+        assert text.startswith(truncated)
+        assert text[len(truncated) :].startswith("\n\n")
+        assert truncate_to_token_budget("short text", max_tokens=500) == "short text"
+
+    def test_segment_word_counts_match_regex_split(self):
+        """Test segment word counts match splitting on [.!?]+ runs."""
+        import re
+
+        from core.dna_engine import _segment_word_counts
+
+        for text in ["", "One two. Three!? Four five six", "...a b　c.\n", "é — x?"]:
+            expected = [len(s.split()) for s in re.split(r"[.!?]+", text)]
+            assert _segment_word_counts(text).tolist() == expected
+
+    def test_load_docx_files_reuses_cached_scans(self, tmp_path):
+        """Test unchanged drafts are served from the scan cache."""
+        import docx
+
+        import core.dna_engine as dna_engine
+
+        for name in ["a.docx", "b.docx"]:
+            document = docx.Document()
+            document.add_paragraph(f"Draft {name}. It may suggest something.")
+            document.save(tmp_path / name)
+
+        cache_path = tmp_path / "author_dna.cache.json"
+        cache = {}
+        first = dna_engine.load_docx_files(tmp_path, cache=cache)
+        dna_engine._write_json(cache_path, cache)
+
+        cache = dna_engine._load_scan_cache(cache_path)
+        cache["a.docx"]["document"]["content"] = "from cache"
+        second = dna_engine.load_docx_files(tmp_path, cache=cache)
+
+        assert [d["filename"] for d in second] == [d["filename"] for d in first]
+        assert {d["content"] for d in second} >= {"from cache"}
+        assert set(cache) == {"a.docx", "b.docx"}
+
+    def test_load_scan_cache_ignores_malformed_entries(self, tmp_path):
+        """Test malformed scan caches load as empty instead of raising."""
+        from core.dna_engine import _load_scan_cache
+
+        cache_path = tmp_path / "author_dna.cache.json"
+        for text in [
+            "[1, 2]",
+            '{"a.docx": {}}',
+            '{"a.docx": {"document": null}}',
+            '{"a.docx": {"document": {"scan": {"phrase_counts": 3}}}}',
+        ]:
+            cache_path.write_text(text)
+            assert _load_scan_cache(cache_path) == {}
+
+    def test_write_json_concurrent_threads(self, tmp_path):
+        """Test threads writing the same file never share a temp file."""
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+
+        import core.dna_engine as dna_engine
+
+        path = tmp_path / "profile.json"
+        payloads = [{"writer": i, "words": list(range(2000))} for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: dna_engine._write_json(path, data), payloads))
+
+        assert json.loads(path.read_text())["words"] == list(range(2000))
+        assert [p.name for p in tmp_path.iterdir()] == ["profile.json"]
+
 
 # =============================================================================
 # AUDITOR TESTS
@@ -314,6 +549,377 @@ class TestRedThread:
         assert engine._score_to_label(30) == "Critical Issues"
 
 
+# =============================================================================
+# CITATIONS TESTS
+# =============================================================================
+
+
+class TestCitations:
+    """Tests for core/citations.py"""
+
+    def test_get_relevant_papers_coalesces_concurrent_calls(self):
+        """Concurrent lookups for the same context should share one ranking."""
+        import threading
+        import time
+
+        from core.citations import ZoteroSentinel
+
+        sentinel = ZoteroSentinel()
+        calls = []
+
+        def slow_rank(context, chapter, top_n):
+            calls.append(context)
+            time.sleep(0.2)
+            return [{"key": "A", "title": "Paper A"}]
+
+        results = []
+        with patch.object(sentinel, "_rank_relevant_papers", side_effect=slow_rank):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        sentinel.get_relevant_papers("shared context", top_n=3)
+                    )
+                )
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(r == [{"key": "A", "title": "Paper A"}] for r in results)
+
+
+# =============================================================================
+# DATA LAB TESTS
+# =============================================================================
+
+
+class TestDataLab:
+    """Tests for core/data_lab.py"""
+
+    def test_simple_sentiment_analysis(self):
+        """Rule-based fallback should count unique lexicon words per text."""
+        from core.data_lab import DataLab
+
+        texts = [
+            "Great food, great staff and excellent value",
+            "Terrible service, rude staff",
+            "",
+            "It was fine",
+        ]
+        result = DataLab()._simple_sentiment_analysis(texts)
+
+        assert result["status"] == "success"
+        assert result["total_analyzed"] == 4
+        assert [r["label"] for r in result["detailed_results"]] == [
+            "positive",
+            "negative",
+            "neutral",
+            "neutral",
+        ]
+        # "great" repeated only counts once; "excellent" adds a second hit
+        assert result["detailed_results"][0]["score"] == pytest.approx(0.7)
+        assert result["distribution"]["neutral"]["count"] == 2
+
+    def test_correlation_cache_sees_in_place_edits(self):
+        """Editing a frame in place should invalidate its cached matrix."""
+        import pandas as pd
+
+        from core.data_lab import DataLab
+
+        lab = DataLab()
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "b": [2.0, 4.1, 5.9, 8.2]})
+        first = lab.correlation_analysis(df)
+        df["b"] = [4.0, 1.0, 3.0, 2.0]
+        second = lab.correlation_analysis(df)
+
+        assert first["matrix"]["a"]["b"] > 0.9
+        assert second["matrix"]["a"]["b"] == round(df["a"].corr(df["b"]), 4)
+
+    def test_analyze_sentiment_skips_duplicate_texts(self):
+        """Duplicate and previously scored texts should not rerun the model."""
+        import pandas as pd
+
+        from core.data_lab import DataLab
+
+        scored = []
+
+        def fake_pipeline(batch, batch_size):
+            scored.extend(batch)
+            return [[{"label": "positive", "score": 0.9}] for _ in batch]
+
+        lab = DataLab()
+        lab._sentiment_pipeline = fake_pipeline
+        df = pd.DataFrame({"review": ["Lovely stay", "Lovely stay", "Too noisy"]})
+
+        first = lab.analyze_sentiment(df, "review")
+        second = lab.analyze_sentiment(df, "review")
+
+        assert sorted(scored) == ["Lovely stay", "Too noisy"]
+        assert first["total_analyzed"] == second["total_analyzed"] == 3
+
+    def test_score_texts_tokenizes_on_calling_thread(self):
+        """Only inference should run in the pool; tokenizing stays serial."""
+        import threading
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        from core.data_lab import DataLab, _OnnxSentimentScorer
+
+        caller = threading.get_ident()
+        tokenize_threads = set()
+
+        class FakeSession:
+            def get_inputs(self):
+                return [SimpleNamespace(name="input_ids")]
+
+            def run(self, outputs, inputs):
+                lengths = inputs["input_ids"]
+                return [np.stack([lengths % 2, 1 - lengths % 2], axis=1) * 3.0]
+
+        class FakeTokenizer:
+            def __call__(self, texts, **kwargs):
+                tokenize_threads.add(threading.get_ident())
+                return {
+                    "input_ids": np.array([len(t) for t in texts]),
+                    "attention_mask": None,
+                }
+
+        scorer = _OnnxSentimentScorer(
+            FakeSession(), FakeTokenizer(), {0: "odd", 1: "even"}
+        )
+
+        lab = DataLab()
+        lab._sentiment_workers = 4
+        texts = ["a" * n for n in range(1, 40)]
+        results = lab._score_texts(scorer, texts, batch_size=3)
+
+        assert tokenize_threads == {caller}
+        assert [r["label"] for r in results] == [
+            "odd" if n % 2 else "even" for n in range(1, 40)
+        ]
+        assert results[0]["score"] == pytest.approx(0.9526, abs=1e-4)
+
+    def test_load_csv_arrow_matches_pandas(self, tmp_path):
+        """The pyarrow reader should return the same frame as pandas."""
+        import pandas as pd
+
+        import core.data_lab as data_lab
+
+        pytest.importorskip("pyarrow")
+        lines = ["when,stamp,label,flag,bit,count,note"]
+        for i in range(200):
+            label = ["x", "NA", "", "null", "y"][i % 5]
+            flag = ["True", "false", ""][i % 3]
+            count = "" if i % 7 == 0 else str(i)
+            note = "None" if i % 11 == 0 else '"ok, fine"'
+            lines.append(
+                f"2024-01-{i % 28 + 1:02d},2024-01-01 10:00:{i % 60:02d},"
+                f"{label},{flag},{i % 2},{count},{note}"
+            )
+        csv_path = tmp_path / "mixed.csv"
+        csv_path.write_text("\n".join(lines) + "\n")
+
+        with patch.object(data_lab, "ARROW_CSV_THRESHOLD", 0):
+            with patch.object(
+                data_lab.DataLab,
+                "_read_csv_arrow",
+                autospec=True,
+                side_effect=data_lab.DataLab._read_csv_arrow,
+            ) as read_arrow:
+                result = data_lab.DataLab().load_csv(csv_path)
+
+        assert read_arrow.called
+        pd.testing.assert_frame_equal(result["dataframe"], pd.read_csv(csv_path))
+
+    def test_eda_cache_hit_matches_miss(self, tmp_path):
+        """A cached EDA report should be identical, types included, to a fresh one."""
+        import pandas as pd
+
+        import core.data_lab as data_lab
+
+        def types(value):
+            if isinstance(value, dict):
+                return {(type(k), k): types(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [types(v) for v in value]
+            return type(value)
+
+        frames = [
+            pd.DataFrame({"a": [1, 2, 3], "b": [2.0, None, 1.0], "c": ["x", "y", "x"]}),
+            pd.DataFrame({0: [1, 2, 3], 1: [2.0, 3.0, 1.0], 2: ["x", "y", "x"]}),
+            pd.DataFrame({"a": [1, 2, 3], "c": [1, "x", 1]}),
+        ]
+        with patch.object(data_lab, "ANALYSIS_CACHE", tmp_path):
+            lab = data_lab.DataLab()
+            for df in frames:
+                miss = lab.run_eda(df)
+                hit = lab.run_eda(df)
+                assert types(hit) == types(miss)
+        # Only the frame whose report survives JSON unchanged is cached
+        assert len(list(tmp_path.glob("eda_*.json"))) == 1
+        assert list(tmp_path.glob(".*.tmp")) == []
+
+    def test_run_eda_streaming_matches_run_eda(self, tmp_path):
+        """Chunked EDA should reproduce the in-memory report."""
+        import numpy as np
+        import pandas as pd
+
+        from core.data_lab import DataLab
+
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "rating": rng.integers(1, 6, 500).astype(float),
+                "price": rng.normal(50, 10, 500),
+                "category": rng.choice(["Hotel", "Restaurant", None], 500),
+            }
+        )
+        df["spend"] = df["price"] * 3 + rng.normal(0, 1, 500)
+        df.loc[::7, "price"] = np.nan
+        df = pd.concat([df, df.head(20)])
+        csv_path = tmp_path / "reviews.csv"
+        df.to_csv(csv_path, index=False)
+
+        lab = DataLab()
+        expected = lab.run_eda(pd.read_csv(csv_path), use_cache=False)
+        streamed = lab.run_eda_streaming(csv_path, chunksize=64)
+
+        assert streamed["status"] == "success"
+        assert streamed["overview"] == expected["overview"]
+        assert streamed["missing_values"] == expected["missing_values"]
+        assert streamed["data_types"] == expected["data_types"]
+        assert streamed["numeric_summary"] == expected["numeric_summary"]
+        assert streamed["correlations"] == expected["correlations"]
+
+    def test_run_eda_streaming_estimates_large_distinct_counts(self, tmp_path):
+        """Past the exact cap, distinct counts should be flagged estimates."""
+        import pandas as pd
+
+        import core.data_lab as data_lab
+
+        n = 20_000
+        df = pd.DataFrame({"id": range(n), "label": [f"v{i % 5000}" for i in range(n)]})
+        df = pd.concat([df, df.head(500)])
+        csv_path = tmp_path / "large.csv"
+        df.to_csv(csv_path, index=False)
+
+        with patch.object(data_lab, "STREAMING_EXACT_DISTINCT", 1000):
+            report = data_lab.DataLab().run_eda_streaming(csv_path, chunksize=2000)
+
+        overview = report["overview"]
+        assert overview["duplicates_estimated"] is True
+        assert abs(overview["duplicates"] - 500) < 0.05 * n
+        id_type = report["data_types"]["columns"]["id"]
+        assert id_type["unique_values_estimated"] is True
+        assert abs(id_type["unique_values"] - n) < 0.05 * n
+        label = report["categorical_summary"]["columns"]["label"]
+        assert label["unique_values_estimated"] is True
+        assert abs(label["unique_values"] - 5000) < 0.05 * 5000
+        assert label["least_common"] == {}
+
+    def test_dashboard_hashes_frame_once_and_caches_json(self):
+        """Dashboard charts should share one frame digest and reuse cached JSON."""
+        import pandas as pd
+
+        import core.data_lab as data_lab
+
+        if not data_lab.PLOTLY_AVAILABLE:
+            pytest.skip("plotly not installed")
+
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, 1.0, 2.0], "c": [1, 2, 2]})
+        lab = data_lab.DataLab()
+        with patch.object(lab, "_frame_digest", wraps=lab._frame_digest) as digest:
+            first = lab.create_dashboard_figures(df)
+        # One digest for the histograms, one for the heatmap's column subset
+        assert digest.call_count == 2
+
+        second = lab.create_dashboard_figures(df)
+        assert [f["figure_json"] for f in first["figures"]] == [
+            f["figure_json"] for f in second["figures"]
+        ]
+        cached = lab._chart_json(
+            df, "histogram", {"x": "a", "title": "Distribution of a"}
+        )
+        assert cached["figure_json"] == first["figures"][0]["figure_json"]
+        assert "figure" not in cached
+
+    def test_chart_cache_distinguishes_array_options(self):
+        """Array options abbreviated in their repr must not share a cache entry."""
+        import numpy as np
+        import pandas as pd
+
+        import core.data_lab as data_lab
+
+        if not data_lab.PLOTLY_AVAILABLE:
+            pytest.skip("plotly not installed")
+
+        df = pd.DataFrame({"a": np.arange(3000.0)})
+        c1 = np.zeros(3000)
+        c2 = c1.copy()
+        c2[1500] = 1.0
+        lab = data_lab.DataLab()
+
+        first = lab._chart_json(df, "scatter", {"x": "a", "y": c1})
+        second = lab._chart_json(df, "scatter", {"x": "a", "y": c2})
+        assert first["figure_json"] != second["figure_json"]
+
+        # Repeated calls return a live figure with real arrays, not JSON blobs
+        lab.generate_chart(df, "scatter", x="a", title="t")
+        result = lab.generate_chart(df, "scatter", x="a", title="t")
+        assert isinstance(result["figure"].data[0].x, np.ndarray)
+
+    def test_narratives_survive_ledger_failure(self):
+        """A failing AI ledger should not discard generated narratives."""
+        import core.data_lab as data_lab
+
+        lab = data_lab.DataLab()
+        lab._llm_available = True
+        lab._llm_gateway = Mock()
+        lab._llm_gateway.generate_content.return_value = {"content": "Text."}
+        items = [
+            {"analysis_results": {"mean": 1.0}, "section_type": "findings"},
+            {"analysis_results": {"mean": 1.0}, "section_type": "discussion"},
+        ]
+        with patch.object(data_lab, "log_ai_usage", side_effect=OSError("disk full")):
+            results = lab.generate_analysis_narratives(items)
+
+        assert [r["status"] for r in results] == ["success", "success"]
+        assert [r["section_type"] for r in results] == ["findings", "discussion"]
+
+    def test_mann_whitney_columns_match_single_column_tests(self):
+        """Testing several columns at once should match one test per column."""
+        import numpy as np
+        import pandas as pd
+
+        from core.data_lab import DataLab
+
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "score": rng.normal(size=60),
+                "rating": rng.integers(1, 6, 60).astype(float),
+                "group": ["a", "b"] * 30,
+            }
+        )
+        df.loc[::9, "score"] = np.nan
+
+        lab = DataLab()
+        result = lab.significance_test(
+            df, "mann_whitney", column=["score", "rating"], group_column="group"
+        )
+
+        for col, col_result in result["columns"].items():
+            single = lab.significance_test(
+                df, "mann_whitney", column=col, group_column="group"
+            )
+            assert col_result == {key: single[key] for key in col_result}
+
+
 # =============================================================================
 # SECRETS UTILS TESTS
 # =============================================================================
@@ -357,6 +963,299 @@ class TestSecretsUtils:
             del os.environ["TEST_EXISTS"]
 
 
+# =============================================================================
+# ETHICS UTILS TESTS
+# =============================================================================
+
+
+class TestEthicsUtils:
+    """Tests for core/ethics_utils.py"""
+
+    def test_scrub_regex_redacts_and_counts_each_type(self):
+        """A single pass should redact every PII type and count it by type."""
+        from core.ethics_utils import EthicsScrubber
+
+        scrubber = EthicsScrubber(use_spacy=False)
+        text = (
+            "Email jane.doe@uni.ac.uk or bob@example.org, call 07700 900123, "
+            "post to SW1A 1AA. Student ID: 12345678."
+        )
+        scrubbed, report = scrubber.scrub_regex(text)
+
+        assert scrubbed == (
+            "Email [EMAIL_REDACTED] or [EMAIL_REDACTED], call [PHONE_REDACTED], "
+            "post to [POSTCODE_REDACTED]. [STUDENT_ID_REDACTED]."
+        )
+        assert report["items_found"] == {
+            "email": 2,
+            "phone_uk": 1,
+            "uk_postcode": 1,
+            "student_id": 1,
+        }
+        assert report["total_redactions"] == 5
+
+    def test_scrub_regex_redacts_overlapping_types(self):
+        """PII overlapping a match of another type should still be redacted."""
+        from core.ethics_utils import EthicsScrubber
+
+        scrubber = EthicsScrubber(use_spacy=False)
+        scrubbed, report = scrubber.scrub_regex("see http://a.co/07700 900123 ok")
+
+        assert scrubbed == "see [URL_REDACTED][PHONE_REDACTED] ok"
+        assert report["items_found"] == {"phone_uk": 1, "url": 1}
+
+    def test_prefiltered_scrub_matches_full_scan(self):
+        """The Hyperscan-prefiltered scrub should redact exactly what re does."""
+        import core.ethics_utils as ethics_utils
+
+        scrubber = ethics_utils.EthicsScrubber(use_spacy=False)
+        texts = [
+            "Mail https://x.com/a@b.com, call +1 555-123-4567 or (555) 123-4567.",
+            "Café “quotes” — DOB: 12/03/1990, ip 10.0.0.1, card 4111 1111 1111 1111",
+            "éSW1A 1AA and SW1A 1AA, NI AB 12 34 56 C, id number 1234567",
+            "Non-breaking SW1A\xa01AA, Arabic digits ٠٧٧٠٠ ٩٠٠١٢٣",
+            "see http://a.co/07700 900123 ok",
+            "No personal data here at all.",
+        ]
+        prefiltered = [scrubber.scrub_regex(text) for text in texts]
+        with patch.object(ethics_utils, "PII_PREFILTER", None):
+            assert prefiltered == [scrubber.scrub_regex(text) for text in texts]
+
+    def test_prefilter_agrees_on_ascii_separators(self):
+        """Separators re counts as whitespace must not hide PII from the prefilter."""
+        import core.ethics_utils as ethics_utils
+
+        scrubber = ethics_utils.EthicsScrubber(use_spacy=False)
+        for sep in "\x1c\x1d\x1e\x1f":
+            texts = [
+                f"call +44{sep}7700{sep}900123 now",
+                f"card 4111{sep}1111{sep}1111{sep}1111",
+                f"NI AB{sep}12{sep}34{sep}56{sep}C",
+            ]
+            prefiltered = [scrubber.scrub_regex(text) for text in texts]
+            with patch.object(ethics_utils, "PII_PREFILTER", None):
+                full_scan = [scrubber.scrub_regex(text) for text in texts]
+            assert prefiltered == full_scan
+            assert all(report["total_redactions"] for _, report in prefiltered)
+
+    def test_scrub_many_batches_ner_and_matches_scrub(self):
+        """Batch scrubbing should run spaCy once, on the text between redactions."""
+        from core.ethics_utils import EthicsScrubber
+
+        def fake_doc(text):
+            start = text.find("Alice")
+            entity = Mock(label_="PERSON", start_char=start, end_char=start + 5)
+            return Mock(ents=[entity] if start >= 0 else [])
+
+        scrubber = EthicsScrubber(use_spacy=False)
+        scrubber.use_spacy = True
+        scrubber.nlp = Mock(side_effect=fake_doc)
+        seen = []
+
+        def fake_pipe(texts, **kwargs):
+            seen.extend(texts)
+            return map(fake_doc, texts)
+
+        scrubber.nlp.pipe.side_effect = fake_pipe
+
+        texts = ["Alice emailed alice@uni.ac.uk", "No names here.", "Ask Alice."]
+        batch = scrubber.scrub_many(texts)
+
+        assert scrubber.nlp.pipe.call_count == 1
+        assert not any("REDACTED" in segment for segment in seen)
+        for text, result in zip(texts, batch):
+            single = scrubber.scrub(text)
+            single.pop("timestamp")
+            result.pop("timestamp")
+            assert result == single
+        assert batch[0]["scrubbed_text"] == "[NAME_REDACTED] emailed [EMAIL_REDACTED]"
+
+    def test_regex_only_scrub_does_not_load_spacy(self):
+        """Scrubbing without names should use a shared regex-only scrubber."""
+        import core.ethics_utils as ethics_utils
+
+        with (
+            patch.object(ethics_utils, "_scrubber_regex", None),
+            patch.object(ethics_utils, "_scrubber_spacy", None),
+        ):
+            result = ethics_utils.scrub_text(
+                "Mail bob@example.org", include_names=False
+            )
+            scrubber = ethics_utils.get_scrubber(include_names=False)
+
+            assert ethics_utils._scrubber_spacy is None
+            assert scrubber.use_spacy is False
+            assert ethics_utils.get_scrubber(include_names=False) is scrubber
+
+        assert result["scrubbed_text"] == "Mail [EMAIL_REDACTED]"
+
+    def test_ledger_writes_rows_in_background(self, tmp_path):
+        """Logged rows should be readable straight away and survive close()."""
+        from datetime import datetime, timedelta
+
+        from core.ethics_utils import AIUsageLedger
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        with AIUsageLedger(log_path=log_path) as ledger:
+            for i in range(3):
+                ledger.log("audit", "user_input", f"prompt {i},\nline two")
+            recent = ledger.get_recent_logs(limit=2)
+            assert [row["prompt_preview"] for row in recent] == [
+                "prompt 1; line two",
+                "prompt 2; line two",
+            ]
+            logged_at = datetime.fromisoformat(recent[-1]["timestamp"])
+            assert abs(datetime.now() - logged_at) < timedelta(minutes=1)
+
+        assert ledger._writer_thread is None
+        stats = AIUsageLedger(log_path=log_path).get_stats()
+        assert stats["total_calls"] == 3
+        assert stats["by_action"] == {"audit": 3}
+
+    def test_ledger_writer_survives_bad_rows(self, tmp_path):
+        """A row that fails to write, or a dead writer, must not lose later rows."""
+        from core.ethics_utils import AIUsageLedger
+
+        with AIUsageLedger(log_path=tmp_path / "ai_usage_log.csv") as ledger:
+            ledger.log("audit", "user_input", "lone \ud800 surrogate")
+            ledger.log("audit", "user_input", "after")
+            ledger.flush()
+            assert ledger._writer_thread.is_alive()
+
+            # A writer that died for any reason is restarted by the next log
+            ledger._queue.put(None)
+            ledger._writer_thread.join()
+            ledger.log("audit", "user_input", "restarted")
+
+            recent = ledger.get_recent_logs(limit=3)
+            assert [row["prompt_preview"] for row in recent] == [
+                "lone ? surrogate",
+                "after",
+                "restarted",
+            ]
+
+    def test_ledger_rows_match_csv_writer(self, tmp_path):
+        """Formatted rows should be byte-identical to csv.writer output."""
+        import csv
+        import io
+
+        from core.ethics_utils import AIUsageLedger
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        with AIUsageLedger(log_path=log_path) as ledger:
+            ledger.log('say "hi", twice', None, 'He said "no"\r', True, 4, "m", "s,1")
+
+        _, row = log_path.read_bytes().decode("utf-8").split("\r\n", 1)
+        fields = next(csv.reader([row]))
+        expected = io.StringIO()
+        csv.writer(expected).writerow(
+            [fields[0], 'say "hi", twice', None, 'He said "no"\r', 13, True, 4]
+            + ["m", "s,1"]
+        )
+        assert row == expected.getvalue()
+
+    def test_ledger_stats_only_scan_new_rows(self, tmp_path):
+        """Stats should come from the sidecar plus rows appended since."""
+        from core.ethics_utils import AIUsageLedger
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        with AIUsageLedger(log_path=log_path) as ledger:
+            ledger.log(
+                "audit", "user_input", "a", was_scrubbed=True, redactions_count=2
+            )
+            ledger.log("draft", "drafts_folder", "b")
+            first = ledger.get_stats()
+
+        assert log_path.with_suffix(".stats.json").exists()
+        # Rows already counted are not read again
+        log_path.write_bytes(log_path.read_bytes().replace(b"draft", b"DRAFT"))
+        with AIUsageLedger(log_path=log_path) as other:
+            other.log("audit", "drafts_folder", "c", redactions_count=1)
+        stats = AIUsageLedger(log_path=log_path).get_stats()
+
+        assert first["total_calls"] == 2
+        assert stats == {
+            "total_calls": 3,
+            "by_action": {"audit": 2, "draft": 1},
+            "by_source": {"user_input": 1, "drafts_folder": 2},
+            "scrubbed_percentage": 33.3,
+            "total_redactions": 3,
+        }
+
+        log_path.with_suffix(".stats.json").unlink()
+        rebuilt = AIUsageLedger(log_path=log_path).get_stats()
+        assert rebuilt["by_action"] == {"audit": 2, "DRAFT": 1}
+
+    def test_ledger_stats_scan_failure_keeps_counts(self, tmp_path):
+        """A scan that fails partway should not skip or half-count rows."""
+        import csv
+
+        import core.ethics_utils as ethics_utils
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        ledger = ethics_utils.AIUsageLedger(log_path=log_path)
+        with ledger:
+            ledger.log("audit", "user_input", "a")
+            assert ledger.get_stats()["total_calls"] == 1
+            ledger.log("draft", "user_input", "b")
+            ledger.log("draft", "user_input", "c")
+            before = dict(ledger._stats)
+
+            real_reader = csv.reader
+
+            def failing_reader(lines):
+                rows = real_reader(lines)
+                yield next(rows)
+                raise OSError("read failed")
+
+            with patch.object(ethics_utils.csv, "reader", failing_reader):
+                with pytest.raises(OSError):
+                    ledger.get_stats()
+
+            assert ledger._stats == before
+            stats = ledger.get_stats()
+        assert stats["total_calls"] == 3
+        assert stats["by_action"] == {"audit": 1, "draft": 2}
+
+    def test_ledger_stats_skip_malformed_rows(self, tmp_path):
+        """Short, long or non-numeric rows should be skipped, not crash stats."""
+        from core.ethics_utils import AIUsageLedger
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        with AIUsageLedger(log_path=log_path) as ledger:
+            ledger.log("audit", "user_input", "a", redactions_count=2)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write("2026-01-01T00:00:00,audit,user_input\n")
+            f.write("\n")
+            f.write("2026-01-01,audit,x,p,1,True,many,m,s\n")
+            f.write("2026-01-01,audit,x,p,1,True,1,m,s,extra\n\xff\n")
+        with AIUsageLedger(log_path=log_path) as ledger:
+            ledger.log("draft", "user_input", "b", was_scrubbed=True)
+            stats = ledger.get_stats()
+
+        assert stats["total_calls"] == 2
+        assert stats["by_action"] == {"audit": 1, "draft": 1}
+        assert stats["total_redactions"] == 2
+
+    def test_recent_logs_tail_matches_full_read(self, tmp_path):
+        """Reading the log's tail should give the same rows as a full read."""
+        import csv
+
+        import core.ethics_utils as ethics_utils
+
+        log_path = tmp_path / "ai_usage_log.csv"
+        with ethics_utils.AIUsageLedger(log_path=log_path) as ledger:
+            for i in range(40):
+                ledger.log("audit", "user_input", "x" * (i * 37))
+            ledger.flush()
+            with open(log_path, newline="", encoding="utf-8") as f:
+                expected = list(csv.DictReader(f))
+
+            with patch.object(ethics_utils, "LEDGER_ROW_BYTES", 16):
+                for limit in (1, 7, 40, 100, 0):
+                    assert ledger.get_recent_logs(limit) == expected[-limit:]
+
+
 # =============================================================================
 # API SERVER TESTS
 # =============================================================================